@@ -1,35 +1,84 @@
 import re
 import os
+import glob
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from itertools import groupby
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from docx import Document
 from docx.enum.text import WD_COLOR_INDEX
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+
+_WS_RE = re.compile(r'\s+')
+_POS_RE = re.compile(r'\s*\([\d,\s]+\)$')
+_PAREN_RE = re.compile(r'\(.*?\)')
+_NUM_PAREN_RE = re.compile(r'(\([0-9.]+\))')
 
 def clean_all_whitespace(text):
-    return re.sub(r'\s+', '', text)
+    return _WS_RE.sub('', text)
+
+# 반복문에서 enum 속성 조회를 피하기 위해 색상 상수를 모듈 수준에 캐시
+_YELLOW = WD_COLOR_INDEX.YELLOW
+_GRAY = WD_COLOR_INDEX.GRAY_25
+_RED = WD_COLOR_INDEX.RED
+
+# 서열 색상 맵은 잔기당 1바이트 코드로 저장 (bytearray)
+_C_NONE, _C_GRAY, _C_YELLOW = 0, 1, 2
+_CODE_COLORS = {_C_NONE: None, _C_GRAY: _GRAY, _C_YELLOW: _YELLOW}
+_GRAY_FILL = bytes.maketrans(bytes([_C_NONE]), bytes([_C_GRAY]))  # YELLOW은 유지
+
+_W_VAL = qn('w:val')
+_XML_SPACE = qn('xml:space')
+_RUN_TEMPLATES = {}
+_RUN_CONTROL_RE = re.compile(r'[\t\n\r]')  # <w:tab/> / <w:br/> 로 바꿔야 하는 문자
+
+def _make_run(text, color=None):
+    # 색상별 <w:r> 템플릿을 한 번만 만들고 복제 (Run 프록시 객체 생성 생략)
+    tpl = _RUN_TEMPLATES.get(color)
+    if tpl is None:
+        tpl = OxmlElement('w:r')
+        if color is not None:
+            rPr = OxmlElement('w:rPr')
+            rPr.append(OxmlElement('w:highlight', {_W_VAL: WD_COLOR_INDEX.to_xml(color)}))
+            tpl.append(rPr)
+        tpl.append(OxmlElement('w:t', {_XML_SPACE: 'preserve'}))
+        _RUN_TEMPLATES[color] = tpl
+    run = deepcopy(tpl)
+    if _RUN_CONTROL_RE.search(text):
+        # 탭/줄바꿈은 add_run()과 같이 python-docx가 <w:tab/>, <w:br/>로 변환
+        run.text = text
+    else:
+        run[-1].text = text
+    return run
+
+def _set_runs(para, runs):
+    para.clear()
+    para._p.extend(runs)
 
 def apply_colors_to_full_seq(para, text, color_map):
     if not para or not color_map: return
-    para.clear()
-    if not text: return
-    current_run_text = ""
-    current_color = color_map[0]
-    for i in range(len(text)):
-        if color_map[i] == current_color:
-            current_run_text += text[i]
-        else:
-            run = para.add_run(current_run_text)
-            run.font.highlight_color = current_color
-            current_run_text = text[i]
-            current_color = color_map[i]
-    run = para.add_run(current_run_text)
-    run.font.highlight_color = current_color
+    if not text:
+        para.clear()
+        return
+    # 같은 색이 연속된 구간을 한 번에 잘라 run으로 만듦
+    runs = []
+    i = 0
+    for code, grp in groupby(color_map):
+        n = sum(1 for _ in grp)
+        runs.append(_make_run(text[i:i + n], _CODE_COLORS[code]))
+        i += n
+    _set_runs(para, runs)
 
 def start_mapping(input_path, output_path):
     doc = Document(input_path)
     current_full_seq_text = ""
     current_full_seq_para = None
-    current_color_map = []
+    current_color_map = bytearray()
     processed_count = 0
 
     for para in doc.paragraphs:
@@ -40,47 +89,74 @@ def start_mapping(input_path, output_path):
                 apply_colors_to_full_seq(current_full_seq_para, current_full_seq_text, current_color_map)
             current_full_seq_text = clean_all_whitespace(text)
             current_full_seq_para = para
-            current_color_map = [None] * len(current_full_seq_text)
+            current_color_map = bytearray(len(current_full_seq_text))
             continue
         if "(" in text and current_full_seq_text:
-            original_peptide = re.sub(r'\s*\([\d,\s]+\)$', '', text).strip()
-            pure_peptide = clean_all_whitespace(re.sub(r'\(.*?\)', '', original_peptide))
+            original_peptide = _POS_RE.sub('', text).strip()
+            pure_peptide = clean_all_whitespace(_PAREN_RE.sub('', original_peptide))
             start_idx = current_full_seq_text.find(pure_peptide)
             if start_idx != -1:
-                for i in range(start_idx, start_idx + len(pure_peptide)):
-                    if current_color_map[i] != WD_COLOR_INDEX.YELLOW:
-                        current_color_map[i] = WD_COLOR_INDEX.GRAY_25
+                end_idx = start_idx + len(pure_peptide)
+                current_color_map[start_idx:end_idx] = current_color_map[start_idx:end_idx].translate(_GRAY_FILL)
                 p_indices = []
+                runs = []
                 temp_idx = 0
-                parts = re.split(r'(\([0-9.]+\))', original_peptide)
-                for part in parts:
-                    if re.match(r'\([0-9.]+\)', part):
-                        current_color_map[start_idx + temp_idx - 1] = WD_COLOR_INDEX.YELLOW
-                        p_indices.append(start_idx + temp_idx)
-                    else:
-                        temp_idx += len(clean_all_whitespace(part))
-                para.clear()
+                # split()은 [텍스트, 마커, 텍스트, 마커, ..., 텍스트] 순서이므로 홀수 인덱스가 마커
+                # 위치 계산과 run 생성을 한 번의 순회로 처리하고 빈 run은 만들지 않음
+                parts = _NUM_PAREN_RE.split(original_peptide)
+                last = len(parts) - 1
                 for i, part in enumerate(parts):
-                    if re.match(r'\([0-9.]+\)', part):
-                        para.add_run(part).font.highlight_color = WD_COLOR_INDEX.YELLOW
-                    else:
-                        if i + 1 < len(parts) and re.match(r'\([0-9.]+\)', parts[i+1]):
-                            para.add_run(part[:-1])
-                            para.add_run(part[-1]).font.highlight_color = WD_COLOR_INDEX.RED
-                        else:
-                            para.add_run(part)
-                para.add_run(f" ({', '.join(map(str, p_indices))})")
+                    if i % 2:
+                        current_color_map[start_idx + temp_idx - 1] = _C_YELLOW
+                        p_indices.append(start_idx + temp_idx)
+                        runs.append(_make_run(part, _YELLOW))
+                        continue
+                    # 대부분 공백 없는 순수 아미노산 문자열이므로 정규식은 그 외의 경우에만 사용
+                    temp_idx += len(part) if part.isalpha() else len(clean_all_whitespace(part))
+                    if i < last and part:
+                        # 마커 바로 앞 잔기는 빨간색
+                        if len(part) > 1:
+                            runs.append(_make_run(part[:-1]))
+                        runs.append(_make_run(part[-1], _RED))
+                    elif part:
+                        runs.append(_make_run(part))
+                runs.append(_make_run(f" ({', '.join(map(str, p_indices))})"))
+                _set_runs(para, runs)
                 processed_count += 1
     if current_full_seq_para:
         apply_colors_to_full_seq(current_full_seq_para, current_full_seq_text, current_color_map)
     doc.save(output_path)
     return processed_count
 
+# --- 여러 문서 일괄 처리 ---
+def _map_one(job):
+    input_path, output_path = job
+    try:
+        return start_mapping(input_path, output_path)
+    except Exception as e:
+        return e
+
+def batch_map(input_paths, output_dir, max_workers=None):
+    # 문서끼리는 서로 독립적이므로 프로세스 풀로 CPU 코어 수만큼 병렬 처리
+    jobs = [(p, os.path.join(output_dir, os.path.splitext(os.path.basename(p))[0] + '_mapped.docx'))
+            for p in input_paths]
+    if len(jobs) <= 1:
+        return {p: _map_one(job) for p, job in zip(input_paths, jobs)}
+    # GUI 작업 스레드에서 호출되므로 fork 대신 spawn 사용 (멀티스레드 프로세스의 fork는 교착 위험)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as ex:
+        return dict(zip(input_paths, ex.map(_map_one, jobs)))
+
+def find_docx_files(folder):
+    # Word 임시 잠금 파일(~$)과 이전 결과 파일은 제외
+    return sorted(p for p in glob.glob(os.path.join(folder, '*.docx'))
+                  if not os.path.basename(p).startswith('~$') and not p.endswith('_mapped.docx'))
+
 # --- GUI 화면 구성 ---
 def run_app():
     root = tk.Tk()
     root.title("인산화 서열 매핑 자동화 도구")
-    root.geometry("400x200")
+    root.geometry("400x290")
+    status = tk.StringVar()
 
     def select_file():
         file_path = filedialog.askopenfilename(title="작업할 Word 파일을 선택하세요", filetypes=[("Word files", "*.docx")])
@@ -95,8 +171,55 @@ def run_app():
         except Exception as e:
             messagebox.showerror("오류", f"작업 중 오류가 발생했습니다:\n{str(e)}")
 
+    def select_folder():
+        folder = filedialog.askdirectory(title="작업할 Word 파일이 있는 폴더를 선택하세요")
+        if not folder: return
+        paths = find_docx_files(folder)
+        if not paths:
+            messagebox.showwarning("알림", "선택한 폴더에 Word 파일이 없습니다.")
+            return
+        out_dir = filedialog.askdirectory(title="결과를 저장할 폴더를 선택하세요", initialdir=folder)
+        if not out_dir: return
+        # 일괄 처리는 작업 스레드에서 실행하고, 결과는 root.after 폴링으로 받아 창이 멈추지 않게 함
+        status.set(f"{len(paths)}개 파일 처리 중... 잠시 기다려 주세요")
+        for b in buttons: b.config(state=tk.DISABLED)
+        results = queue.Queue()
+
+        def worker():
+            try:
+                results.put(batch_map(paths, out_dir))
+            except Exception as e:
+                results.put(e)
+
+        threading.Thread(target=worker, daemon=True).start()
+        root.after(200, poll_batch, results, paths)
+
+    def poll_batch(results, paths):
+        try:
+            res = results.get_nowait()
+        except queue.Empty:
+            root.after(200, poll_batch, results, paths)
+            return
+        status.set("")
+        for b in buttons: b.config(state=tk.NORMAL)
+        if isinstance(res, Exception):
+            messagebox.showerror("오류", f"일괄 처리 중 오류가 발생했습니다:\n{str(res)}")
+            return
+        failed = [f"{os.path.basename(p)}: {r}" for p, r in res.items() if isinstance(r, Exception)]
+        done = sum(r for r in res.values() if not isinstance(r, Exception))
+        msg = f"{len(paths) - len(failed)}/{len(paths)}개 파일 완료, 처리된 항목: {done}개"
+        if failed:
+            messagebox.showerror("오류", msg + "\n\n실패:\n" + "\n".join(failed))
+        else:
+            messagebox.showinfo("성공", msg)
+
     tk.Label(root, text="인산화 서열 매핑 프로그램", font=("Arial", 16, "bold"), pady=20).pack()
-    tk.Button(root, text="파일 선택 및 실행하기", command=select_file, bg="blue", fg="white", width=20, height=2).pack()
+    file_btn = tk.Button(root, text="파일 선택 및 실행하기", command=select_file, bg="blue", fg="white", width=20, height=2)
+    folder_btn = tk.Button(root, text="폴더 일괄 실행하기", command=select_folder, bg="blue", fg="white", width=20, height=2)
+    buttons = (file_btn, folder_btn)
+    file_btn.pack()
+    folder_btn.pack(pady=10)
+    tk.Label(root, textvariable=status, fg="gray").pack()
     root.mainloop()
 
 if __name__ == "__main__":
@@ -1,50 +1,61 @@
 import re
+import os
+import glob
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
+from itertools import groupby
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from docx import Document
 from docx.enum.text import WD_COLOR_INDEX
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 
 
 # --- 32종 Kinase 인산화 모티프 DB ---
 MOTIF_DB = [
     # --- [1] Basophilic & IIS Signaling ---
-    ("PKA", r"([RK][RK].([ST]))|([RK].{1,2}([ST]))"), # R-R-X-S/T (Proline 제외)
-    ("AKT", r"R.[RK]..([ST])(?!P)[LIVMFY]"),            # R-X-R-X-X-S/T-Phi
-    ("AMPK", r"([LIVMF].R.([ST])(?!P).{2}[LIVMF])|([LIVMF].R..([ST])(?!P))"),
-    ("S6K1", r"[RK]R..([ST])[LIVMF]"),             # (R/K)-R-X-X-S/T-Phi
-    ("SGK1", r"R.R..([ST])[LIV]"),                 # R-X-R-X-X-S/T-Phi
-    ("RSK", r"[RK]R.([ST])"),                      # (R/K)-R-X-S/T
-    ("PKC", r"[RK].([ST])[LIV][RK]"),              # (R/K)-X-S/T-Phi-(R/K)
-    ("PKD", r"L.R..([ST])"),                       # L-X-R-X-X-S/T
-    ("LKB1", r"[LIVM][RK].([ST]).{2}[LIVM]"),      # Phi-(R/K)-X-S/T-X-X-Phi
+    ("PKA", re.compile(r"([RK][RK].([ST]))|([RK].{1,2}([ST]))")), # R-R-X-S/T (Proline 제외)
+    ("AKT", re.compile(r"R.[RK]..([ST])(?!P)[LIVMFY]")),            # R-X-R-X-X-S/T-Phi
+    ("AMPK", re.compile(r"([LIVMF].R.([ST])(?!P).{2}[LIVMF])|([LIVMF].R..([ST])(?!P))")),
+    ("S6K1", re.compile(r"[RK]R..([ST])[LIVMF]")),             # (R/K)-R-X-X-S/T-Phi
+    ("SGK1", re.compile(r"R.R..([ST])[LIV]")),                 # R-X-R-X-X-S/T-Phi
+    ("RSK", re.compile(r"[RK]R.([ST])")),                      # (R/K)-R-X-S/T
+    ("PKC", re.compile(r"[RK].([ST])[LIV][RK]")),              # (R/K)-X-S/T-Phi-(R/K)
+    ("PKD", re.compile(r"L.R..([ST])")),                       # L-X-R-X-X-S/T
+    ("LKB1", re.compile(r"[LIVM][RK].([ST]).{2}[LIVM]")),      # Phi-(R/K)-X-S/T-X-X-Phi
 
     # --- [2] Proline-directed (MAPK & Cell Cycle) ---
-    ("CDK", r"([ST])P.[RK]"),                      # S/T-P-X-K/R
-    ("Erk", r"[PLV].([ST])P"),                     # P-X-S/T-P (-2 위치 P/L/V 선호)
-    ("JNK", r"P.([ST])P"),                         # P-X-S/T-P (표준)
-    ("p38&MAPK", r"[LIVMFY].([ST])P"),             # Phi-X-S/T-P (-2 위치 소수성)
-    ("mTOR", r"([ST])P[FLIV]"),                    # S/T-P-Phi
-    ("GSK-3beta", r"([ST]).{3}[ST]"),              # S/T-X-X-X-S(p) (프라이밍 필수)
-    ("DYRK1A", r"R..([ST])P"),                     # R-X-X-S/T-P
-    ("HIPK2", r"([ST])P.K"),                       # S/T-P-X-K
-    ("BUB1", r"([ST])P.R"),                        # S/T-P-X-R
+    ("CDK", re.compile(r"([ST])P.[RK]")),                      # S/T-P-X-K/R
+    ("Erk", re.compile(r"[PLV].([ST])P")),                     # P-X-S/T-P (-2 위치 P/L/V 선호)
+    ("JNK", re.compile(r"P.([ST])P")),                         # P-X-S/T-P (표준)
+    ("p38&MAPK", re.compile(r"[LIVMFY].([ST])P")),             # Phi-X-S/T-P (-2 위치 소수성)
+    ("mTOR", re.compile(r"([ST])P[FLIV]")),                    # S/T-P-Phi
+    ("GSK-3beta", re.compile(r"([ST]).{3}[ST]")),              # S/T-X-X-X-S(p) (프라이밍 필수)
+    ("DYRK1A", re.compile(r"R..([ST])P")),                     # R-X-X-S/T-P
+    ("HIPK2", re.compile(r"([ST])P.K")),                       # S/T-P-X-K
+    ("BUB1", re.compile(r"([ST])P.R")),                        # S/T-P-X-R
 
     # --- [3] Acidophilic & DNA Damage ---
-    ("CK2", r"([ST])(?!P).{1,2}[DE]{2,3}"),                    # S/T-X-X-D/E
-    ("CK1", r"([DE]{1,2}.{1,2}([ST]))|(([ST]).{2,3}([ST]))"), # Acidic or Primed
-    ("PLK1", r"[DE].([ST])[LIVMF]"),               # D/E-X-S/T-Phi
-    ("ATM&ATR", r"([ST])Q"),                       # S/T-Q
-    ("DNA-PK", r"([ST])Q[DE]"),                    # S/T-Q-Acidic
-    ("IKK", r"[DE].{1,2}([ST])G.([ST])"),          # D-S-G-X-X-S 관련 변형
+    ("CK2", re.compile(r"([ST])(?!P).{1,2}[DE]{2,3}")),                    # S/T-X-X-D/E
+    ("CK1", re.compile(r"([DE]{1,2}.{1,2}([ST]))|(([ST]).{2,3}([ST]))")), # Acidic or Primed
+    ("PLK1", re.compile(r"[DE].([ST])[LIVMF]")),               # D/E-X-S/T-Phi
+    ("ATM&ATR", re.compile(r"([ST])Q")),                       # S/T-Q
+    ("DNA-PK", re.compile(r"([ST])Q[DE]")),                    # S/T-Q-Acidic
+    ("IKK", re.compile(r"[DE].{1,2}([ST])G.([ST])")),          # D-S-G-X-X-S 관련 변형
 
     # --- [4] Other Key Kinases ---
-    ("CaMK2", r"[RK]..([ST])([LIVMF])?"),
-    ("Aurora A", r"[RK].([ST])[LIVMF]"),           # (R/K)-X-S/T-Phi
-    ("Aurora B", r"[RK]R.([ST])[LIVMF]"),          # (R/K)-R-X-S/T-Phi
-    ("Chk1", r"[LIVMF]R..([ST])"),                 # Phi-R-X-X-S/T
-    ("Chk2", r"R..([ST])[LIVMF]"),                 # R-X-X-S/T-Phi
-    ("NEK2", r"[LIVMF]R..([ST])"),                 # Phi-R-X-X-S/T
-    ("MK2", r"[LIVM].R.([ST])")
+    ("CaMK2", re.compile(r"[RK]..([ST])([LIVMF])?")),
+    ("Aurora A", re.compile(r"[RK].([ST])[LIVMF]")),           # (R/K)-X-S/T-Phi
+    ("Aurora B", re.compile(r"[RK]R.([ST])[LIVMF]")),          # (R/K)-R-X-S/T-Phi
+    ("Chk1", re.compile(r"[LIVMF]R..([ST])")),                 # Phi-R-X-X-S/T
+    ("Chk2", re.compile(r"R..([ST])[LIVMF]")),                 # R-X-X-S/T-Phi
+    ("NEK2", re.compile(r"[LIVMF]R..([ST])")),                 # Phi-R-X-X-S/T
+    ("MK2", re.compile(r"[LIVM].R.([ST])"))
 ]
 
 
@@ -54,13 +65,17 @@ def identify_kinase(full_seq, index):
     """
     start = max(0, index - 7)
     end = min(len(full_seq), index + 7)
-    fragment = full_seq[start:end]
-    
+    return _identify_kinase_cached(full_seq[start:end])
+
+@lru_cache(maxsize=4096)
+def _identify_kinase_cached(fragment):
+    # 결과는 fragment(14-mer)에만 의존하므로 같은 fragment는 재검사하지 않음
     matches = []
     
     # 모든 패턴을 순회하며 매칭되는 모든 이름을 리스트에 추가
+    # (하나의 alternation 정규식으로 합치면 같은 위치에서 겹치는 모티프가 누락되므로 패턴별로 검사)
     for name, pattern in MOTIF_DB:
-        if re.search(pattern, fragment):
+        if pattern.search(fragment):
             matches.append(name)
     
     # 매칭된 것이 있다면 쉼표로 구분된 문자열 반환, 없으면 None
@@ -68,30 +83,68 @@ def identify_kinase(full_seq, index):
 
 # --- [2] 데이터 처리 및 매핑 로직 ---
 
+_WS_RE = re.compile(r'\s+')
+_POS_RE = re.compile(r'\s*\([\d,\s]+\)$')
+_PAREN_RE = re.compile(r'\(.*?\)')
+_NUM_PAREN_RE = re.compile(r'(\([0-9.]+\))')
+
 def clean_all_whitespace(text):
-    return re.sub(r'\s+', '', text)
+    return _WS_RE.sub('', text)
+
+# 반복문에서 enum 속성 조회를 피하기 위해 색상 상수를 모듈 수준에 캐시
+_YELLOW = WD_COLOR_INDEX.YELLOW
+_GRAY = WD_COLOR_INDEX.GRAY_25
+_RED = WD_COLOR_INDEX.RED
+
+# 서열 색상 맵은 잔기당 1바이트 코드로 저장 (bytearray)
+_C_NONE, _C_GRAY, _C_YELLOW = 0, 1, 2
+_CODE_COLORS = {_C_NONE: None, _C_GRAY: _GRAY, _C_YELLOW: _YELLOW}
+_GRAY_FILL = bytes.maketrans(bytes([_C_NONE]), bytes([_C_GRAY]))  # YELLOW은 유지
+
+_W_VAL = qn('w:val')
+_XML_SPACE = qn('xml:space')
+_RUN_TEMPLATES = {}
+_RUN_CONTROL_RE = re.compile(r'[\t\n\r]')  # <w:tab/> / <w:br/> 로 바꿔야 하는 문자
+
+def _make_run(text, color=None):
+    # 색상별 <w:r> 템플릿을 한 번만 만들고 복제 (Run 프록시 객체 생성 생략)
+    tpl = _RUN_TEMPLATES.get(color)
+    if tpl is None:
+        tpl = OxmlElement('w:r')
+        if color is not None:
+            rPr = OxmlElement('w:rPr')
+            rPr.append(OxmlElement('w:highlight', {_W_VAL: WD_COLOR_INDEX.to_xml(color)}))
+            tpl.append(rPr)
+        tpl.append(OxmlElement('w:t', {_XML_SPACE: 'preserve'}))
+        _RUN_TEMPLATES[color] = tpl
+    run = deepcopy(tpl)
+    if _RUN_CONTROL_RE.search(text):
+        # 탭/줄바꿈은 add_run()과 같이 python-docx가 <w:tab/>, <w:br/>로 변환
+        run.text = text
+    else:
+        run[-1].text = text
+    return run
+
+def _set_runs(para, runs):
+    para.clear()
+    para._p.extend(runs)
 
 def apply_colors_to_full_seq(para, text, color_map):
     if not para or not color_map: return
-    para.clear()
-    current_run_text = ""
-    current_color = color_map[0]
-    for i in range(len(text)):
-        if color_map[i] == current_color:
-            current_run_text += text[i]
-        else:
-            run = para.add_run(current_run_text)
-            run.font.highlight_color = current_color
-            current_run_text = text[i]
-            current_color = color_map[i]
-    run = para.add_run(current_run_text)
-    run.font.highlight_color = current_color
+    # 같은 색이 연속된 구간을 한 번에 잘라 run으로 만듦
+    runs = []
+    i = 0
+    for code, grp in groupby(color_map):
+        n = sum(1 for _ in grp)
+        runs.append(_make_run(text[i:i + n], _CODE_COLORS[code]))
+        i += n
+    _set_runs(para, runs)
 
 def start_mapping(input_path, output_path):
     doc = Document(input_path)
     current_full_seq_text = ""
     current_full_seq_para = None
-    current_color_map = []
+    current_color_map = bytearray()
     processed_count = 0
 
     for para in doc.paragraphs:
@@ -103,27 +156,30 @@ def start_mapping(input_path, output_path):
                 apply_colors_to_full_seq(current_full_seq_para, current_full_seq_text, current_color_map)
             current_full_seq_text = clean_all_whitespace(text)
             current_full_seq_para = para
-            current_color_map = [None] * len(current_full_seq_text)
+            current_color_map = bytearray(len(current_full_seq_text))
             continue
             
         if "(" in text and current_full_seq_text:
-            original_peptide = re.sub(r'\s*\([\d,\s]+\)$', '', text).strip()
-            pure_peptide = clean_all_whitespace(re.sub(r'\(.*?\)', '', original_peptide))
+            original_peptide = _POS_RE.sub('', text).strip()
+            pure_peptide = clean_all_whitespace(_PAREN_RE.sub('', original_peptide))
             start_idx = current_full_seq_text.find(pure_peptide)
             
             if start_idx != -1:
-                for i in range(start_idx, start_idx + len(pure_peptide)):
-                    if current_color_map[i] != WD_COLOR_INDEX.YELLOW:
-                        current_color_map[i] = WD_COLOR_INDEX.GRAY_25
+                end_idx = start_idx + len(pure_peptide)
+                current_color_map[start_idx:end_idx] = current_color_map[start_idx:end_idx].translate(_GRAY_FILL)
                 
                 results_labels = [] 
+                runs = []
                 temp_idx = 0
-                parts = re.split(r'(\([0-9.]+\))', original_peptide)
+                # split()은 [텍스트, 마커, 텍스트, 마커, ..., 텍스트] 순서이므로 홀수 인덱스가 마커
+                # 위치/kinase 분석과 run 생성을 한 번의 순회로 처리하고 빈 run은 만들지 않음
+                parts = _NUM_PAREN_RE.split(original_peptide)
+                last = len(parts) - 1
                 
-                for part in parts:
-                    if re.match(r'\([0-9.]+\)', part):
+                for i, part in enumerate(parts):
+                    if i % 2:
                         real_idx = start_idx + temp_idx
-                        current_color_map[real_idx - 1] = WD_COLOR_INDEX.YELLOW
+                        current_color_map[real_idx - 1] = _C_YELLOW
                         
                         # --- [중첩 분석 수행] ---
                         kinase = identify_kinase(current_full_seq_text, real_idx - 1)
@@ -131,21 +187,20 @@ def start_mapping(input_path, output_path):
                         if kinase:
                             label += f" {kinase}"
                         results_labels.append(label)
-                    else:
-                        temp_idx += len(clean_all_whitespace(part))
+                        runs.append(_make_run(part, _YELLOW))
+                        continue
+                    # 대부분 공백 없는 순수 아미노산 문자열이므로 정규식은 그 외의 경우에만 사용
+                    temp_idx += len(part) if part.isalpha() else len(clean_all_whitespace(part))
+                    if i < last and part:
+                        # 마커 바로 앞 잔기는 빨간색
+                        if len(part) > 1:
+                            runs.append(_make_run(part[:-1]))
+                        runs.append(_make_run(part[-1], _RED))
+                    elif part:
+                        runs.append(_make_run(part))
                 
-                para.clear()
-                for i, part in enumerate(parts):
-                    if re.match(r'\([0-9.]+\)', part):
-                        para.add_run(part).font.highlight_color = WD_COLOR_INDEX.YELLOW
-                    else:
-                        if i + 1 < len(parts) and re.match(r'\([0-9.]+\)', parts[i+1]):
-                            para.add_run(part[:-1])
-                            para.add_run(part[-1]).font.highlight_color = WD_COLOR_INDEX.RED
-                        else:
-                            para.add_run(part)
-                
-                para.add_run(f" ({', '.join(results_labels)})")
+                runs.append(_make_run(f" ({', '.join(results_labels)})"))
+                _set_runs(para, runs)
                 processed_count += 1
                 
     if current_full_seq_para:
@@ -153,10 +208,34 @@ def start_mapping(input_path, output_path):
     doc.save(output_path)
     return processed_count
 
+# --- 여러 문서 일괄 처리 ---
+def _map_one(job):
+    input_path, output_path = job
+    try:
+        return start_mapping(input_path, output_path)
+    except Exception as e:
+        return e
+
+def batch_map(input_paths, output_dir, max_workers=None):
+    # 문서끼리는 서로 독립적이므로 프로세스 풀로 CPU 코어 수만큼 병렬 처리
+    jobs = [(p, os.path.join(output_dir, os.path.splitext(os.path.basename(p))[0] + '_mapped.docx'))
+            for p in input_paths]
+    if len(jobs) <= 1:
+        return {p: _map_one(job) for p, job in zip(input_paths, jobs)}
+    # GUI 작업 스레드에서 호출되므로 fork 대신 spawn 사용 (멀티스레드 프로세스의 fork는 교착 위험)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn')) as ex:
+        return dict(zip(input_paths, ex.map(_map_one, jobs)))
+
+def find_docx_files(folder):
+    # Word 임시 잠금 파일(~$)과 이전 결과 파일은 제외
+    return sorted(p for p in glob.glob(os.path.join(folder, '*.docx'))
+                  if not os.path.basename(p).startswith('~$') and not p.endswith('_mapped.docx'))
+
 def run_app():
     root = tk.Tk()
     root.title("인산화 모티프 분석 도구")
-    root.geometry("400x200")
+    root.geometry("400x290")
+    status = tk.StringVar()
 
     def select_file():
         file_path = filedialog.askopenfilename(title="Word 파일 선택", filetypes=[("Word files", "*.docx")])
@@ -169,8 +248,55 @@ def run_app():
         except Exception as e:
             messagebox.showerror("오류", f"에러 발생:\n{str(e)}")
 
+    def select_folder():
+        folder = filedialog.askdirectory(title="Word 파일 폴더 선택")
+        if not folder: return
+        paths = find_docx_files(folder)
+        if not paths:
+            messagebox.showwarning("알림", "선택한 폴더에 Word 파일이 없습니다.")
+            return
+        out_dir = filedialog.askdirectory(title="결과를 저장할 폴더를 선택하세요", initialdir=folder)
+        if not out_dir: return
+        # 일괄 처리는 작업 스레드에서 실행하고, 결과는 root.after 폴링으로 받아 창이 멈추지 않게 함
+        status.set(f"{len(paths)}개 파일 처리 중... 잠시 기다려 주세요")
+        for b in buttons: b.config(state=tk.DISABLED)
+        results = queue.Queue()
+
+        def worker():
+            try:
+                results.put(batch_map(paths, out_dir))
+            except Exception as e:
+                results.put(e)
+
+        threading.Thread(target=worker, daemon=True).start()
+        root.after(200, poll_batch, results, paths)
+
+    def poll_batch(results, paths):
+        try:
+            res = results.get_nowait()
+        except queue.Empty:
+            root.after(200, poll_batch, results, paths)
+            return
+        status.set("")
+        for b in buttons: b.config(state=tk.NORMAL)
+        if isinstance(res, Exception):
+            messagebox.showerror("오류", f"일괄 처리 중 오류가 발생했습니다:\n{str(res)}")
+            return
+        failed = [f"{os.path.basename(p)}: {r}" for p, r in res.items() if isinstance(r, Exception)]
+        done = sum(r for r in res.values() if not isinstance(r, Exception))
+        msg = f"{len(paths) - len(failed)}/{len(paths)}개 파일 완료, 처리된 항목: {done}개"
+        if failed:
+            messagebox.showerror("오류", msg + "\n\n실패:\n" + "\n".join(failed))
+        else:
+            messagebox.showinfo("성공", msg)
+
     tk.Label(root, text="Kinase Motif Mapping", font=("Arial", 16, "bold"), pady=20).pack()
-    tk.Button(root, text="파일 선택 및 실행", command=select_file, bg="blue", fg="white", width=20, height=2).pack()
+    file_btn = tk.Button(root, text="파일 선택 및 실행", command=select_file, bg="blue", fg="white", width=20, height=2)
+    folder_btn = tk.Button(root, text="폴더 일괄 실행", command=select_folder, bg="blue", fg="white", width=20, height=2)
+    buttons = (file_btn, folder_btn)
+    file_btn.pack()
+    folder_btn.pack(pady=10)
+    tk.Label(root, textvariable=status, fg="gray").pack()
     root.mainloop()
 
 if __name__ == "__main__":
@@ -36,7 +36,23 @@ Programmatic ::
 __version__ = "2.1.0"
 __author__ = "Phosphom Team"
 
-from .pipeline import run_pipeline  # noqa: F401
-from .pipeline import get_default_ref_path  # noqa: F401
-
 __all__ = ["run_pipeline", "get_default_ref_path", "__version__"]
+
+# The pipeline pulls in pandas, python-docx and openpyxl; import it on first
+# use (PEP 562) so that ``python -m Phosphom --version`` / ``--help`` and
+# submodule imports stay fast.
+_LAZY_PIPELINE_ATTRS = frozenset({"run_pipeline", "get_default_ref_path"})
+
+
+def __getattr__(name):
+    if name in _LAZY_PIPELINE_ATTRS:
+        from . import pipeline
+
+        value = getattr(pipeline, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_PIPELINE_ATTRS)
@@ -52,6 +52,12 @@ def main() -> None:
         help="Path to reference Excel (.xlsx) file (PhosphoSitePlus). "
         "If omitted, the bundled 'Substrates of protein.xlsx' is used.",
     )
+    parser.add_argument(
+        "--no-ref-cache",
+        action="store_true",
+        help="Always re-read the reference file instead of reusing the "
+        "parsed copy cached per user (PHOSPHOM_CACHE_DIR or ~/.cache/phosphom)",
+    )
     parser.add_argument(
         "-o",
         "--output",
@@ -112,6 +118,7 @@ def main() -> None:
             output_dir=args.output,
             base_name=args.name,
             min_confidence=args.confidence,
+            use_ref_cache=not args.no_ref_cache,
         )
 
         acc = result["acc_summary"]
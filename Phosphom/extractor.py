@@ -24,11 +24,14 @@ Gene symbol extraction priority:
 from __future__ import annotations
 
 import logging
+import posixpath
 import re
-from typing import List, Tuple
+import zipfile
+from functools import lru_cache
+from typing import Dict, Iterator, List, Tuple
 
 import pandas as pd
-from docx import Document
+from lxml import etree
 
 from .motif_db import KINASE_KEYS
 
@@ -38,12 +41,20 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 # Header-detection patterns (NCBI accession & related)
 # ---------------------------------------------------------------------------
-_ACCESSION_RE = [
-    re.compile(r"(?:sp|tr)\|[A-Z0-9]{6,10}\|"),          # UniProt
-    re.compile(r"\b(?:NP|NM|XP|XM|YP|NC)_\d{3,}"),       # NCBI RefSeq
-    re.compile(r"\b[A-Z]{3}\d{5}(?:\.\d+)?\b"),           # GenBank protein
-    re.compile(r"\bgi\|\d+"),                               # NCBI GI (legacy)
-]
+# One pattern for every accession format.  The word-boundary formats share a
+# single leading \b, so at positions inside a word (e.g. a long sequence
+# line) all of them are rejected with one check.
+_ACCESSION_RE = re.compile(
+    r"""
+    \b(?:
+        [A-Z]{3}\d{5}(?:\.\d+)?\b            # GenBank protein
+      | (?:NP|NM|XP|XM|YP|NC)_\d{3,}        # NCBI RefSeq
+      | gi\|\d+                             # NCBI GI (legacy)
+    )
+    | (?:sp|tr)\|[A-Z0-9]{6,10}\|           # UniProt
+    """,
+    re.VERBOSE,
+)
 
 _HEADER_KEYWORDS: List[str] = [
     "mrna", "protein", "isoform", "variant", "complete cds", "partial cds",
@@ -51,12 +62,46 @@ _HEADER_KEYWORDS: List[str] = [
     "gene", "chromosome", "predicted", "uncharacterized",
 ]
 
+# All header keywords folded into one alternation: a single scan per line
+_HEADER_KEYWORD_RE = re.compile("|".join(map(re.escape, _HEADER_KEYWORDS)))
+
+# Motif cleaning keeps only A–Z after upper-casing.  Probability markers
+# such as "(0.477)" or "(1)" consist solely of characters this drops, so
+# they need no separate pass.
+_DELETE_NON_AZ = {c: None for c in range(128) if not 65 <= c <= 90}
+_NON_AZ_RE = re.compile(r"[^A-Z]")  # fallback for non-ASCII text
 
+
+# ---------------------------------------------------------------------------
+# Kinase-name scanner
+# ---------------------------------------------------------------------------
+# One zero-width lookahead per position reports every kinase occurrence in a
+# single pass, including overlapping names (``MK2`` inside ``CaMK2``), exactly
+# like the per-key substring tests it replaces.  No key is a prefix of
+# another, so at most one alternative can start at any position.
+#
+# ASCII text is upper-cased once and scanned case-sensitively, which avoids
+# per-character case folding inside the regex engine; the IGNORECASE variant
+# is kept for non-ASCII text, where upper() and case folding can disagree.
+_KINASE_SCAN_UPPER_RE = re.compile(
+    r"(?=(" + "|".join(re.escape(k.upper()) for k in KINASE_KEYS)
+    + r")(?::(\d+\.\d+))?)"
+)
+_KINASE_SCAN_RE = re.compile(
+    r"(?=(" + "|".join(map(re.escape, KINASE_KEYS)) + r")(?::(\d+\.\d+))?)",
+    re.IGNORECASE,
+)
+_KINASE_BY_UPPER: Dict[str, str] = {k.upper(): k for k in KINASE_KEYS}
+_KINASE_ORDER: Dict[str, int] = {k: i for i, k in enumerate(KINASE_KEYS)}
+
+
+@lru_cache(maxsize=4096)
 def is_header_line(text: str) -> bool:
     """Detect whether *text* is a gene/protein header line.
 
     Uses NCBI RefSeq, UniProt, GenBank accession patterns, FASTA '>'
-    prefix, and biological descriptor keywords.
+    prefix, and biological descriptor keywords.  Results are memoised, as
+    the same lines recur across runs on related documents.
     """
     if len(text) < 10:
         return False
@@ -64,14 +109,13 @@ def is_header_line(text: str) -> bool:
     if text.startswith(">"):
         return True
     # Accession patterns
-    for pat in _ACCESSION_RE:
-        if pat.search(text):
-            return True
+    if _ACCESSION_RE.search(text):
+        return True
     # Keyword-based detection
-    text_lower = text.lower()
-    return any(kw in text_lower for kw in _HEADER_KEYWORDS)
+    return _HEADER_KEYWORD_RE.search(text.lower()) is not None
 
 
+@lru_cache(maxsize=4096)
 def extract_gene_symbol(text: str) -> str:
     """Extract a gene symbol from a header line.
 
@@ -112,10 +156,10 @@ def extract_gene_symbol(text: str) -> str:
 
 def clean_motif_sequence(text: str) -> str:
     """Remove probability annotations and non-amino-acid characters."""
-    text = re.sub(r"\(0\.\d+\)", "", text)
-    text = re.sub(r"\(1\)", "", text)
-    text = re.sub(r"[^A-Z]", "", text.upper())
-    return text.strip()
+    text = text.upper()
+    if text.isascii():
+        return text.translate(_DELETE_NON_AZ)
+    return _NON_AZ_RE.sub("", text)
 
 
 def extract_kinases_from_info(info_text: str) -> Tuple[str, str]:
@@ -130,25 +174,120 @@ def extract_kinases_from_info(info_text: str) -> Tuple[str, str]:
         ``(comma_separated_kinases, comma_separated_confidences)``
         Confidence is empty-string per kinase when scores are absent.
     """
-    found_kinases: List[str] = []
-    found_scores: List[str] = []
-    upper_info = info_text.upper()
-
-    for key in KINASE_KEYS:
-        # Try v2 scored format first: "KINASE:0.XX"
-        score_pat = re.compile(re.escape(key) + r":(\d+\.\d+)", re.IGNORECASE)
-        score_match = score_pat.search(info_text)
-        if score_match:
-            if key not in found_kinases:
-                found_kinases.append(key)
-                found_scores.append(score_match.group(1))
-        elif key.upper() in upper_info:
+    if info_text.isascii():
+        matches = _KINASE_SCAN_UPPER_RE.finditer(info_text.upper())
+    else:
+        matches = _KINASE_SCAN_RE.finditer(info_text)
+
+    scores: Dict[str, str] = {}
+    for m in matches:
+        key = _KINASE_BY_UPPER.get(m.group(1).upper())
+        if key is None:
+            continue
+        if m.group(2) is not None:
+            # v2 scored format "KINASE:0.XX" — first scored occurrence wins
+            if not scores.get(key):
+                scores[key] = m.group(2)
+        else:
             # Legacy format (no score)
-            if key not in found_kinases:
-                found_kinases.append(key)
-                found_scores.append("")
+            scores.setdefault(key, "")
 
-    return ", ".join(found_kinases), ", ".join(found_scores)
+    found_kinases = sorted(scores, key=_KINASE_ORDER.__getitem__)
+    return (
+        ", ".join(found_kinases),
+        ", ".join(scores[k] for k in found_kinases),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Read-only document access
+# ---------------------------------------------------------------------------
+# Extraction only needs paragraph text, so the main document part is parsed
+# with lxml directly instead of building python-docx Paragraph/Run proxies.
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+_W_BODY = f"{{{_W_NS}}}body"
+_W_P = f"{{{_W_NS}}}p"
+_W_T = f"{{{_W_NS}}}t"
+_W_BR = f"{{{_W_NS}}}br"
+_W_CR = f"{{{_W_NS}}}cr"
+_W_NO_BREAK_HYPHEN = f"{{{_W_NS}}}noBreakHyphen"
+_W_TYPE = f"{{{_W_NS}}}type"
+_OFFICE_DOCUMENT_REL = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships/"
+    "officeDocument"
+)
+_PKG_RELS_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+# Same parser options python-docx uses for document parts
+_XML_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+# Run content that contributes to paragraph text, in document order
+_RUN_CONTENT_XPATH = etree.XPath(
+    "(w:r | w:hyperlink/w:r)/*[self::w:t or self::w:tab or self::w:ptab"
+    " or self::w:br or self::w:cr or self::w:noBreakHyphen]",
+    namespaces={"w": _W_NS},
+)
+
+
+def _main_document_part(zf: zipfile.ZipFile) -> str:
+    """Return the zip member name of the main document part."""
+    try:
+        rels = etree.fromstring(zf.read("_rels/.rels"), _XML_PARSER)
+    except KeyError:
+        return "word/document.xml"
+    for rel in rels.iter(f"{{{_PKG_RELS_NS}}}Relationship"):
+        if rel.get("Type") == _OFFICE_DOCUMENT_REL:
+            return posixpath.normpath(rel.get("Target", "").lstrip("/"))
+    return "word/document.xml"
+
+
+def _paragraph_text(p) -> str:
+    """Return the text of a ``<w:p>`` element as ``Paragraph.text`` does.
+
+    Text of runs and hyperlinked runs is concatenated; tabs map to ``\\t``,
+    line breaks to ``\\n`` and non-breaking hyphens to ``-``.
+    """
+    parts: List[str] = []
+    for e in _RUN_CONTENT_XPATH(p):
+        tag = e.tag
+        if tag == _W_T:
+            parts.append(e.text or "")
+        elif tag == _W_BR:
+            # Page and column breaks carry no text
+            if e.get(_W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag == _W_CR:
+            parts.append("\n")
+        elif tag == _W_NO_BREAK_HYPHEN:
+            parts.append("-")
+        else:  # w:tab, w:ptab
+            parts.append("\t")
+    return "".join(parts)
+
+
+def iter_paragraph_texts(word_file: str) -> Iterator[str]:
+    """Yield the text of each body-level paragraph of a Word (.docx) file.
+
+    Matches ``[p.text for p in Document(word_file).paragraphs]``: table
+    cells, headers and footers are not included.
+    """
+    with zipfile.ZipFile(word_file) as zf, zf.open(_main_document_part(zf)) as fh:
+        # Stream the part: each body paragraph is read as soon as it is
+        # complete and then dropped, so the whole tree is never held at once
+        for _, p in etree.iterparse(
+            fh,
+            events=("end",),
+            tag=_W_P,
+            remove_blank_text=True,
+            resolve_entities=False,
+        ):
+            parent = p.getparent()
+            if parent is None or parent.tag != _W_BODY:
+                continue  # table cell, text box, ...
+            yield _paragraph_text(p)
+            p.clear()
+            while p.getprevious() is not None:
+                del parent[0]
 
 
 # ---------------------------------------------------------------------------
@@ -167,12 +306,15 @@ def extract_data_from_docx(word_file: str) -> pd.DataFrame:
     pd.DataFrame
         Columns: ``Gene Name``, ``Motif``, ``Kinase Name``, ``Confidence``.
     """
-    doc = Document(word_file)
-    extracted_data: list = []
+    # One list per column; the frame is built from them once at the end
+    genes: List[str] = []
+    motifs: List[str] = []
+    kinase_names: List[str] = []
+    confidence_values: List[str] = []
     current_gene_symbol: str = "Unknown"
 
-    for para in doc.paragraphs:
-        text = para.text.strip()
+    for text in iter_paragraph_texts(word_file):
+        text = text.strip()
         if not text:
             continue
 
@@ -192,15 +334,18 @@ def extract_data_from_docx(word_file: str) -> pd.DataFrame:
             kinases, confidences = extract_kinases_from_info(info_part)
 
             if clean_seq and 3 < len(clean_seq) < 100:
-                extracted_data.append(
-                    {
-                        "Gene Name": current_gene_symbol,
-                        "Motif": clean_seq,
-                        "Kinase Name": kinases,
-                        "Confidence": confidences,
-                    }
-                )
-
-    df = pd.DataFrame(extracted_data)
+                genes.append(current_gene_symbol)
+                motifs.append(clean_seq)
+                kinase_names.append(kinases)
+                confidence_values.append(confidences)
+
+    df = pd.DataFrame(
+        {
+            "Gene Name": genes,
+            "Motif": motifs,
+            "Kinase Name": kinase_names,
+            "Confidence": confidence_values,
+        }
+    )
     logger.info("Extracted %d motif entries from %s", len(df), word_file)
     return df
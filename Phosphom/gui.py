@@ -31,6 +31,7 @@ def build_gui() -> None:
     out_var = tk.StringVar()
     base_var = tk.StringVar(value="result")
     conf_var = tk.StringVar(value="0.0")
+    cache_var = tk.BooleanVar(value=True)
 
     # ── File selection callbacks ──────────────────────────────────────────
     def select_word():
@@ -53,6 +54,7 @@ def build_gui() -> None:
         word_path = word_var.get().strip()
         output_dir = out_var.get().strip()
         base_name = base_var.get().strip() or "result"
+        use_ref_cache = cache_var.get()
 
         try:
             min_conf = float(conf_var.get().strip())
@@ -76,6 +78,7 @@ def build_gui() -> None:
                     output_dir=output_dir,
                     base_name=base_name,
                     min_confidence=min_conf,
+                    use_ref_cache=use_ref_cache,
                 )
                 root.after(0, lambda: _on_success(result))
             except Exception as e:
@@ -145,6 +148,11 @@ def build_gui() -> None:
         side="left"
     )
 
+    row_idx += 1
+    tk.Checkbutton(
+        frame, text="Reuse cached reference data", variable=cache_var
+    ).grid(row=row_idx, column=1, sticky="w", padx=5)
+
     # Start button
     run_btn = tk.Button(
         root,
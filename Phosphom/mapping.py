@@ -11,10 +11,13 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import List, Optional
+from copy import deepcopy
+from typing import Dict, List, Optional
 
 from docx import Document
 from docx.enum.text import WD_COLOR_INDEX
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
 
 from .motif_db import identify_kinases
 
@@ -25,15 +28,34 @@ logger = logging.getLogger(__name__)
 # Constants
 # ---------------------------------------------------------------------------
 AMINO_ACIDS = frozenset("ACDEFGHIKLMNPQRSTVWY")
+_DELETE_AMINO_ACIDS = str.maketrans("", "", "".join(AMINO_ACIDS))
 MIN_SEQUENCE_LENGTH: int = 30  # residues — handles small proteins (e.g. ubiquitin)
 
+# Pre-compiled patterns used for every paragraph / peptide part
+_ANNOTATED_RE = re.compile(r"\(\d")  # parenthesised digits in a peptide line
+_TRAIL_POS_RE = re.compile(r"\s*\([\d,\s]+\)$")  # trailing "(123, 456)"
+_PAREN_STRIP_RE = re.compile(r"\(.*?\)")
+_PROB_SPLIT_RE = re.compile(r"(\([0-9.]+\))")  # keeps the markers
+_PROB_MATCH_RE = re.compile(r"\([0-9.]+\)")
+
+# Per-residue colour map: one byte code per residue of the full sequence
+_C_NONE, _C_GRAY, _C_YELLOW = 0, 1, 2
+_CODE_COLORS = {
+    _C_NONE: None,
+    _C_GRAY: WD_COLOR_INDEX.GRAY_25,
+    _C_YELLOW: WD_COLOR_INDEX.YELLOW,
+}
+_GRAY_FILL = bytes.maketrans(bytes([_C_NONE]), bytes([_C_GRAY]))  # keeps yellow
+_COLOR_RUN_RE = re.compile(rb"(.)\1*", re.DOTALL)  # maximal same-colour runs
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 def clean_all_whitespace(text: str) -> str:
     """Remove every whitespace character from *text*."""
-    return re.sub(r"\s+", "", text)
+    # str.split() breaks on exactly the characters matched by \s
+    return "".join(text.split())
 
 
 def is_protein_sequence(text: str) -> bool:
@@ -48,39 +70,67 @@ def is_protein_sequence(text: str) -> bool:
     cleaned = clean_all_whitespace(text).upper()
     if len(cleaned) < MIN_SEQUENCE_LENGTH:
         return False
-    aa_count = sum(1 for c in cleaned if c in AMINO_ACIDS)
+    # Count residues in C: whatever survives deleting the amino acids is noise
+    aa_count = len(cleaned) - len(cleaned.translate(_DELETE_AMINO_ACIDS))
     if aa_count / len(cleaned) < 0.90:
         return False
     # Parenthesised digits indicate an annotated peptide, not a raw sequence
-    if re.search(r"\(\d", text):
+    if _ANNOTATED_RE.search(text):
         return False
     return True
 
 
-def apply_colors_to_full_seq(
-    para, text: str, color_map: List[Optional[int]]
-) -> None:
+# ---------------------------------------------------------------------------
+# Run construction
+# ---------------------------------------------------------------------------
+# Runs are appended as raw <w:r> elements cloned from one cached template per
+# highlight colour.  This skips python-docx's Run/Font proxies and the
+# per-property XPath lookups behind add_run() + font.highlight_color, which
+# otherwise dominate the mapping step.
+_RUN_TEMPLATES: Dict[Optional[WD_COLOR_INDEX], object] = {}
+_W_VAL = qn("w:val")
+_XML_SPACE = qn("xml:space")
+_RUN_CONTROL_RE = re.compile(r"[\t\n\r]")  # need <w:tab/> / <w:br/> elements
+
+
+def _add_run(para, text: str, color: Optional[WD_COLOR_INDEX] = None) -> None:
+    """Append a run with *text* and optional highlight *color* to *para*."""
+    if _RUN_CONTROL_RE.search(text):
+        # Let python-docx translate tabs and line breaks
+        run = para.add_run(text)
+        if color is not None:
+            run.font.highlight_color = color
+        return
+    tpl = _RUN_TEMPLATES.get(color)
+    if tpl is None:
+        tpl = OxmlElement("w:r")
+        if color is not None:
+            rPr = OxmlElement("w:rPr")
+            rPr.append(
+                OxmlElement("w:highlight", {_W_VAL: WD_COLOR_INDEX.to_xml(color)})
+            )
+            tpl.append(rPr)
+        tpl.append(OxmlElement("w:t", {_XML_SPACE: "preserve"}))
+        _RUN_TEMPLATES[color] = tpl
+    r = deepcopy(tpl)
+    r[-1].text = text
+    para._p.append(r)
+
+
+def apply_colors_to_full_seq(para, text: str, color_map: bytearray) -> None:
     """Apply per-residue colour highlighting to a full-sequence paragraph.
 
-    Groups consecutive residues sharing the same colour into single Word
-    runs for compact document rendering.
+    *color_map* holds one colour code (``_C_*``) per residue.  Groups
+    consecutive residues sharing the same colour into single Word runs for
+    compact document rendering.
     """
     if not para or not color_map:
         return
     para.clear()
-    current_run_text = ""
-    current_color = color_map[0]
-    for i in range(len(text)):
-        if color_map[i] == current_color:
-            current_run_text += text[i]
-        else:
-            run = para.add_run(current_run_text)
-            run.font.highlight_color = current_color
-            current_run_text = text[i]
-            current_color = color_map[i]
-    if current_run_text:
-        run = para.add_run(current_run_text)
-        run.font.highlight_color = current_color
+    # Run boundaries are found by the regex engine; only runs are visited here
+    for m in _COLOR_RUN_RE.finditer(color_map):
+        start, end = m.span()
+        _add_run(para, text[start:end], _CODE_COLORS[color_map[start]])
 
 
 # ---------------------------------------------------------------------------
@@ -114,7 +164,7 @@ def start_mapping(
     doc = Document(input_path)
     current_full_seq_text: str = ""
     current_full_seq_para = None
-    current_color_map: List[Optional[int]] = []
+    current_color_map = bytearray()
     processed_count: int = 0
 
     for para in doc.paragraphs:
@@ -133,7 +183,7 @@ def start_mapping(
                 )
             current_full_seq_text = clean_all_whitespace(text).upper()
             current_full_seq_para = para
-            current_color_map = [None] * len(current_full_seq_text)
+            current_color_map = bytearray(len(current_full_seq_text))
             logger.debug(
                 "Detected protein sequence: %d residues", len(current_full_seq_text)
             )
@@ -142,9 +192,9 @@ def start_mapping(
         # --- Process peptide lines with phospho-site markers ---
         if "(" in text and current_full_seq_text:
             # Remove trailing position annotation like (123, 456)
-            original_peptide = re.sub(r"\s*\([\d,\s]+\)$", "", text).strip()
+            original_peptide = _TRAIL_POS_RE.sub("", text).strip()
             pure_peptide = clean_all_whitespace(
-                re.sub(r"\(.*?\)", "", original_peptide)
+                _PAREN_STRIP_RE.sub("", original_peptide)
             ).upper()
             start_idx = current_full_seq_text.find(pure_peptide)
 
@@ -155,25 +205,24 @@ def start_mapping(
                 continue
 
             # Colour the peptide region gray (non-phospho residues)
-            for i in range(start_idx, start_idx + len(pure_peptide)):
-                if i < len(current_color_map) and (
-                    current_color_map[i] != WD_COLOR_INDEX.YELLOW
-                ):
-                    current_color_map[i] = WD_COLOR_INDEX.GRAY_25
+            end_idx = start_idx + len(pure_peptide)
+            current_color_map[start_idx:end_idx] = current_color_map[
+                start_idx:end_idx
+            ].translate(_GRAY_FILL)
 
             # Split peptide by probability markers: e.g. "ABCS(0.477)EFK"
             results_labels: List[str] = []
             temp_idx = 0
-            parts = re.split(r"(\([0-9.]+\))", original_peptide)
+            parts = _PROB_SPLIT_RE.split(original_peptide)
 
             for part in parts:
-                if re.match(r"\([0-9.]+\)", part):
+                if _PROB_MATCH_RE.match(part):
                     real_idx = start_idx + temp_idx
                     phospho_pos = real_idx - 1
 
                     # Bounds check — prevents silent bug when marker is at pos 0
                     if 0 <= phospho_pos < len(current_color_map):
-                        current_color_map[phospho_pos] = WD_COLOR_INDEX.YELLOW
+                        current_color_map[phospho_pos] = _C_YELLOW
 
                         kinase_hits = identify_kinases(
                             current_full_seq_text, phospho_pos, min_confidence
@@ -199,21 +248,17 @@ def start_mapping(
             # Rewrite paragraph with colour highlighting
             para.clear()
             for i, part in enumerate(parts):
-                if re.match(r"\([0-9.]+\)", part):
-                    run = para.add_run(part)
-                    run.font.highlight_color = WD_COLOR_INDEX.YELLOW
+                if _PROB_MATCH_RE.match(part):
+                    _add_run(para, part, WD_COLOR_INDEX.YELLOW)
                 else:
-                    if i + 1 < len(parts) and re.match(
-                        r"\([0-9.]+\)", parts[i + 1]
-                    ):
+                    if i + 1 < len(parts) and _PROB_MATCH_RE.match(parts[i + 1]):
                         if part:  # guard against empty string
-                            para.add_run(part[:-1])
-                            run = para.add_run(part[-1])
-                            run.font.highlight_color = WD_COLOR_INDEX.RED
+                            _add_run(para, part[:-1])
+                            _add_run(para, part[-1], WD_COLOR_INDEX.RED)
                     else:
-                        para.add_run(part)
+                        _add_run(para, part)
 
-            para.add_run(f" ({', '.join(results_labels)})")
+            _add_run(para, f" ({', '.join(results_labels)})")
             processed_count += 1
 
     # Flush the last sequence's colouring
@@ -36,7 +36,8 @@ References
 from __future__ import annotations
 
 import re
-from typing import Dict, List, NamedTuple, Tuple
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -254,6 +255,18 @@ MOTIF_DB: List[MotifEntry] = [
 ]
 
 
+# Hot-path view of MOTIF_DB for identify_kinases: bound ``search`` methods
+# ordered by descending specificity (stable, so ties keep MOTIF_DB order).
+# The first hit per kinase is then its best score, and the scan can stop at
+# the first entry below the confidence threshold.
+_MOTIF_FAST: Tuple[Tuple[Callable, str, float], ...] = tuple(
+    sorted(
+        ((e.pattern.search, e.kinase, e.specificity) for e in MOTIF_DB),
+        key=lambda t: -t[2],
+    )
+)
+
+
 # ---------------------------------------------------------------------------
 # Auto-derived kinase keys (preserving first-seen order, no duplicates)
 # ---------------------------------------------------------------------------
@@ -277,9 +290,11 @@ CELL_SIGNAL_CATEGORY_ORDER: List[str] = [
 TOP_KINASES_N: int = 5
 
 
+@lru_cache(maxsize=4096)
 def _normalize_kinase_key(name: str) -> str:
     """Normalize kinase name for dictionary look-ups (lowercase, no spaces)."""
-    return re.sub(r"\s+", "", str(name)).lower()
+    # str.split() breaks on exactly the characters matched by \s
+    return "".join(str(name).split()).lower()
 
 
 CELL_SIGNAL_MAP: Dict[str, str] = {
@@ -354,16 +369,37 @@ def identify_kinases(
         If the same kinase matches via multiple patterns, only the highest
         score is kept.
     """
+    return list(_match_window(_extract_window(full_seq, index), min_confidence))
+
+
+def _extract_window(full_seq: str, index: int) -> str:
+    """Return the ±``WINDOW_HALF`` fragment around *index*, clipped to bounds."""
     start = max(0, index - WINDOW_HALF)
     end = min(len(full_seq), index + WINDOW_HALF + 1)
-    fragment = full_seq[start:end]
+    return full_seq[start:end]
+
 
+# Overlapping peptides re-report the same site, and proteomes repeat the same
+# 15-mer contexts, so results are memoised per (fragment, threshold).  A tuple is
+# cached so callers cannot mutate a shared result; use
+# ``_match_window.cache_info()`` to inspect the hit rate and
+# ``_match_window.cache_clear()`` after editing ``MOTIF_DB`` at runtime.
+@lru_cache(maxsize=65536)
+def _match_window(
+    fragment: str, min_confidence: float
+) -> Tuple[Tuple[str, float], ...]:
+    """Match every motif against *fragment*; see :func:`identify_kinases`."""
     hits: Dict[str, float] = {}
-    for entry in MOTIF_DB:
-        if entry.pattern.search(fragment):
-            if entry.specificity >= min_confidence:
-                # Keep highest score per kinase
-                if entry.kinase not in hits or entry.specificity > hits[entry.kinase]:
-                    hits[entry.kinase] = entry.specificity
-
-    return sorted(hits.items(), key=lambda x: -x[1])
+    # Each motif is searched on its own: a fused (?P<..>)|(?P<..>) pattern
+    # reports one alternative per position and no overlapping matches, so
+    # kinases sharing a site (e.g. CDK / HIPK2 / BUB1) would be dropped.
+    for search, kinase, specificity in _MOTIF_FAST:
+        if specificity < min_confidence:
+            break  # every remaining entry scores lower
+        if kinase in hits:
+            continue  # already holds its highest score
+        if search(fragment) is not None:
+            hits[kinase] = specificity
+
+    # Insertion order already follows _MOTIF_FAST: descending confidence
+    return tuple(hits.items())
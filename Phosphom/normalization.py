@@ -8,7 +8,7 @@ for cell-signaling pathway analysis.
 from __future__ import annotations
 
 import logging
-from typing import Tuple
+from typing import List, Tuple
 
 import pandas as pd
 
@@ -57,17 +57,13 @@ def normalize_kinase_rows(df: pd.DataFrame) -> pd.DataFrame:
     if has_conf:
         df["Confidence"] = df["Confidence"].fillna("").astype(str).str.split(",")
 
-        # Ensure same-length lists (pad confidence with "" if shorter)
-        def _align(row):
-            k_list = row["Kinase Name"]
-            c_list = row["Confidence"]
-            while len(c_list) < len(k_list):
-                c_list.append("")
-            return k_list, c_list[: len(k_list)]
-
-        aligned = df.apply(_align, axis=1, result_type="expand")
-        df["Kinase Name"] = aligned[0]
-        df["Confidence"] = aligned[1]
+        # Ensure same-length lists (pad confidence with "" if shorter).  One
+        # list comprehension over both columns avoids apply(axis=1), which
+        # boxes every row into a Series.
+        df["Confidence"] = [
+            c[: len(k)] if len(c) >= len(k) else c + [""] * (len(k) - len(c))
+            for k, c in zip(df["Kinase Name"].to_list(), df["Confidence"].to_list())
+        ]
         df = df.explode(["Kinase Name", "Confidence"])
         df["Confidence"] = df["Confidence"].str.strip()
     else:
@@ -84,6 +80,26 @@ def normalize_kinase_rows(df: pd.DataFrame) -> pd.DataFrame:
 # ---------------------------------------------------------------------------
 # Cell-signaling tables
 # ---------------------------------------------------------------------------
+def _join_sorted_by_group(
+    group_ids: List[int], n_groups: int, values: pd.Series
+) -> List[str]:
+    """Join the distinct non-blank stripped string forms of *values* per group.
+
+    *group_ids* gives each row's group number (``GroupBy.ngroup()``).  Rows
+    are bucketed in one pass instead of ``groupby.apply``, which builds a
+    Series per group; stripping runs on each group's distinct values only.
+    """
+    buckets: List[set] = [set() for _ in range(n_groups)]
+    for gid, value in zip(group_ids, values.to_list()):
+        buckets[gid].add(value)
+    joined = []
+    for bucket in buckets:
+        names = {str(v).strip() for v in bucket}
+        names.discard("")
+        joined.append(", ".join(sorted(names)))
+    return joined
+
+
 def build_cell_signal_tables(
     df: pd.DataFrame,
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
@@ -98,92 +114,78 @@ def build_cell_signal_tables(
     -------
     tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]
         ``(gene_summary, overall_summary, top_kinases_per_signal)``
+
+    Notes
+    -----
+    All groupbys use ``observed=True``, so the tables list only the
+    (gene, signal) and (signal, kinase) combinations present in *df*.  On
+    pandas < 3, where ``observed`` defaulted to ``False``, earlier versions
+    also emitted every unobserved category combination with a zero count.
     """
     required = {"Kinase Name", "Gene Name"}
     missing = required - set(df.columns)
     if missing:
         raise ValueError(f"Required columns are missing: {missing}")
 
-    temp = df.copy()
-    temp["Cell Signal"] = temp["Kinase Name"].apply(
-        lambda x: CELL_SIGNAL_MAP.get(_normalize_kinase_key(x), "Unknown")
-    )
-    temp = temp[temp["Cell Signal"] != "Unknown"].copy()
-    temp["Cell Signal"] = pd.Categorical(
-        temp["Cell Signal"],
+    # Only the three key columns are needed; no full-frame copy.  The signal
+    # lookup runs once per distinct kinase name and is broadcast back through
+    # the factorize codes.  Kinases outside CELL_SIGNAL_MAP map to None,
+    # which becomes NaN in the categorical and is dropped below.
+    temp = df[["Gene Name", "Motif", "Kinase Name"]]
+    codes, uniques = pd.factorize(temp["Kinase Name"], use_na_sentinel=False)
+    signals = pd.Categorical(
+        [CELL_SIGNAL_MAP.get(_normalize_kinase_key(k)) for k in uniques],
         categories=CELL_SIGNAL_CATEGORY_ORDER,
         ordered=True,
     )
+    temp = temp.assign(**{"Cell Signal": signals.take(codes)})
+    temp = temp[temp["Cell Signal"].notna()]
     temp = temp.drop_duplicates(subset=["Gene Name", "Motif", "Kinase Name"])
 
     # ── Gene-level summary ────────────────────────────────────────────────
-    grouped = temp.groupby(["Gene Name", "Cell Signal"], dropna=False)
-    gene_counts = grouped["Motif"].nunique().reset_index(name="Count")
-    gene_motifs = (
-        grouped["Motif"]
-        .apply(
-            lambda x: ", ".join(
-                sorted({str(v).strip() for v in x if str(v).strip()})
-            )
-        )
-        .reset_index(name="Motifs")
-    )
-    gene_kinases = (
-        grouped["Kinase Name"]
-        .apply(
-            lambda x: ", ".join(
-                sorted({str(v).strip() for v in x if str(v).strip()})
-            )
-        )
-        .reset_index(name="Kinases")
+    grouped = temp.groupby(["Gene Name", "Cell Signal"], dropna=False, observed=True)
+    gene_summary = grouped["Motif"].nunique().reset_index(name="Count")
+    group_ids = grouped.ngroup().to_list()  # row -> position in gene_summary
+    gene_summary["Motifs"] = _join_sorted_by_group(
+        group_ids, len(gene_summary), temp["Motif"]
     )
-    gene_summary = (
-        gene_counts.merge(gene_motifs, on=["Gene Name", "Cell Signal"])
-        .merge(gene_kinases, on=["Gene Name", "Cell Signal"])
-        .sort_values(["Gene Name", "Cell Signal"])
-        .reset_index(drop=True)
+    gene_summary["Kinases"] = _join_sorted_by_group(
+        group_ids, len(gene_summary), temp["Kinase Name"]
     )
+    gene_summary = gene_summary.sort_values(["Gene Name", "Cell Signal"])
+    gene_summary = gene_summary.reset_index(drop=True)
 
     # ── Overall summary ───────────────────────────────────────────────────
+    # nunique already counts distinct motifs, so no drop_duplicates pass;
+    # the categorical Cell Signal dtype carries through the groupby.
     overall = (
-        temp.drop_duplicates(subset=["Motif", "Cell Signal"])
-        .groupby("Cell Signal", dropna=False)["Motif"]
+        temp.groupby("Cell Signal", dropna=False, observed=True)["Motif"]
         .nunique()
-        .rename_axis("Cell Signal")
         .reset_index(name="Count")
     )
-    overall["Cell Signal"] = pd.Categorical(
-        overall["Cell Signal"],
-        categories=CELL_SIGNAL_CATEGORY_ORDER,
-        ordered=True,
-    )
     overall = overall.sort_values("Cell Signal").reset_index(drop=True)
     total = overall["Count"].sum()
     overall["Percent"] = (overall["Count"] / total * 100).round(2) if total else 0
 
     # ── Top kinases per signal ────────────────────────────────────────────
-    top_base = temp.drop_duplicates(subset=["Motif", "Cell Signal", "Kinase Name"])
     top_counts = (
-        top_base.groupby(["Cell Signal", "Kinase Name"], dropna=False)["Motif"]
+        temp.groupby(
+            ["Cell Signal", "Kinase Name"], dropna=False, observed=True
+        )["Motif"]
         .nunique()
         .reset_index(name="Unique Motifs")
     )
-    top_counts["Cell Signal"] = pd.Categorical(
-        top_counts["Cell Signal"],
-        categories=CELL_SIGNAL_CATEGORY_ORDER,
-        ordered=True,
-    )
     top_counts = top_counts.sort_values(
         ["Cell Signal", "Unique Motifs", "Kinase Name"],
         ascending=[True, False, True],
     )
     top_kinases = (
-        top_counts.groupby("Cell Signal", dropna=False)
+        top_counts.groupby("Cell Signal", dropna=False, observed=True)
         .head(TOP_KINASES_N)
         .copy()
         .reset_index(drop=True)
     )
-    top_kinases["Rank"] = top_kinases.groupby("Cell Signal").cumcount() + 1
+    top_kinases["Rank"] = top_kinases.groupby("Cell Signal", observed=True).cumcount() + 1
     top_kinases = top_kinases[["Cell Signal", "Rank", "Kinase Name", "Unique Motifs"]]
 
     logger.info(
@@ -16,6 +16,7 @@ output Excel ``metrics`` sheet for reproducibility.
 from __future__ import annotations
 
 import datetime
+import importlib.util
 import logging
 import os
 from typing import Any, Dict, Optional
@@ -53,12 +54,29 @@ def get_default_ref_path() -> str:
     return DEFAULT_REF_PATH
 
 
+# ---------------------------------------------------------------------------
+# Excel writer engine
+# ---------------------------------------------------------------------------
+def _excel_engine() -> str:
+    """Return the Excel writer engine used for the validated workbook.
+
+    ``xlsxwriter`` writes cells without building openpyxl's in-memory cell
+    objects, so it is used when installed (``pip install phosphom[fast]``);
+    ``openpyxl`` (a required dependency) is the fallback.  The chosen
+    engine is recorded in the ``metrics`` sheet metadata.
+    """
+    if importlib.util.find_spec("xlsxwriter") is not None:
+        return "xlsxwriter"
+    return "openpyxl"
+
+
 def run_pipeline(
     word_path: str,
     ref_path: Optional[str] = None,
     output_dir: str = ".",
     base_name: str = "result",
     min_confidence: float = 0.0,
+    use_ref_cache: bool = True,
 ) -> Dict[str, Any]:
     """Execute the full Phosphom analysis pipeline.
 
@@ -76,6 +94,11 @@ def run_pipeline(
         Base filename prefix for outputs (default ``"result"``).
     min_confidence : float
         Minimum motif-matching confidence score (default 0.0).
+    use_ref_cache : bool
+        Reuse the parsed reference sheets from the per-user cache directory
+        (``$PHOSPHOM_CACHE_DIR``, else e.g. ``~/.cache/phosphom``) while the
+        workbook is unchanged (default ``True``).  Nothing is written next
+        to the workbook.
 
     Returns
     -------
@@ -111,7 +134,9 @@ def run_pipeline(
 
     # ── Step 4: Validation ────────────────────────────────────────────────
     logger.info("Step 4/5: Validating against PSP reference …")
-    final_df, acc_summary = validate_predictions(df_norm, ref_path)
+    final_df, acc_summary = validate_predictions(
+        df_norm, ref_path, use_cache=use_ref_cache
+    )
 
     # ── Step 5: Scoring ───────────────────────────────────────────────────
     logger.info("Step 5/5: Calculating F1 metrics …")
@@ -123,12 +148,14 @@ def run_pipeline(
     )
 
     # ── Metadata for reproducibility ──────────────────────────────────────
+    excel_engine = _excel_engine()
     metadata: Dict[str, Any] = {
         "phosphom_version": __version__,
         "timestamp": datetime.datetime.now().isoformat(),
         "input_file": os.path.basename(word_path),
         "reference_file": os.path.basename(ref_path),
         "min_confidence": min_confidence,
+        "excel_engine": excel_engine,
     }
 
     metrics_df = pd.DataFrame(
@@ -143,7 +170,7 @@ def run_pipeline(
     )
 
     # ── Write Excel output ────────────────────────────────────────────────
-    with pd.ExcelWriter(excel_path, engine="openpyxl") as writer:
+    with pd.ExcelWriter(excel_path, engine=excel_engine) as writer:
         final_df.to_excel(writer, index=False, sheet_name="validated_data")
         metrics_df.to_excel(writer, index=False, sheet_name="metrics")
 
@@ -9,6 +9,8 @@ Key improvements over v1
   eliminating false positives from substring matching (e.g. CK1 ≠ CK12).
 * Reference data is read via ``ExcelFile.parse()`` instead of repeated
   ``pd.read_excel()`` calls, opening the file only once.
+* The extracted reference sequences are cached as JSON in a per-user cache
+  directory and reused until the workbook changes.
 * F1 calculation uses the same ``_normalize_name_for_matching`` helper
   for consistent name comparison across the pipeline.
 * Substring validation requires minimum sequence length to prevent
@@ -17,9 +19,14 @@ Key improvements over v1
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
 import re
-from typing import Dict, List, Tuple
+import sys
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -30,29 +37,174 @@ logger = logging.getLogger(__name__)
 # Minimum sequence length for reliable substring matching in validation
 _MIN_MATCH_LEN: int = 7
 
+# Separator for the per-kinase joined reference string (never part of a motif)
+_REF_SEP: str = "\x00"
+
+# Per-user cache of parsed reference data, one JSON file per workbook path
+_REF_CACHE_SUFFIX: str = ".refcache.json"
+_REF_CACHE_VERSION: int = 1  # bump when the parsed format changes
+_REF_CACHE_DIR_ENV: str = "PHOSPHOM_CACHE_DIR"  # overrides the default location
+
+# Pre-compiled patterns for name normalisation and list-field splitting
+_NAME_STRIP_RE = re.compile(r"[&\s\-_/]")
+_FIELD_SPLIT_RE = re.compile(r"[;,]")
+
 
 # ---------------------------------------------------------------------------
 # Name normalisation helpers
 # ---------------------------------------------------------------------------
+@lru_cache(maxsize=4096)
 def _normalize_name_for_matching(name: str) -> str:
     """Normalise a kinase/sheet name for comparison.
 
     Strips ``& - _ / spaces`` and uppercases so that e.g.
-    ``"p38&MAPK"`` and ``"p38 MAPK"`` compare as equal.
+    ``"p38&MAPK"`` and ``"p38 MAPK"`` compare as equal.  Memoised: the
+    same few kinase names are compared for every motif row.
     """
-    return re.sub(r"[&\s\-_/]", "", str(name)).upper()
+    if not isinstance(name, str):
+        name = str(name)
+    return _NAME_STRIP_RE.sub("", name).upper()
 
 
 # ---------------------------------------------------------------------------
 # Reference data loading
 # ---------------------------------------------------------------------------
-def load_reference_data(ref_file_path: str) -> Dict[str, List[str]]:
+def _ref_cache_key(ref_file_path: str) -> Tuple[int, int, int, Tuple[str, ...]]:
+    """Return the key identifying one version of a reference workbook."""
+    st = os.stat(ref_file_path)
+    return _REF_CACHE_VERSION, st.st_mtime_ns, st.st_size, tuple(KINASE_KEYS)
+
+
+def _ref_cache_dir() -> str:
+    """Return the per-user directory holding reference caches.
+
+    ``$PHOSPHOM_CACHE_DIR`` takes precedence over the platform default:
+    ``%LOCALAPPDATA%\\Phosphom\\Cache`` on Windows,
+    ``~/Library/Caches/Phosphom`` on macOS and ``$XDG_CACHE_HOME/phosphom``
+    (``~/.cache/phosphom``) elsewhere.
+    """
+    override = os.environ.get(_REF_CACHE_DIR_ENV)
+    if override:
+        return override
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser(
+            os.path.join("~", "AppData", "Local")
+        )
+        return os.path.join(base, "Phosphom", "Cache")
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Caches/Phosphom")
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "phosphom")
+
+
+def _ref_cache_path(ref_file_path: str) -> str:
+    """Return the cache file for the workbook at absolute *ref_file_path*.
+
+    Files are named by a hash of the path, so nothing is ever written next
+    to the workbook (e.g. into an installed package directory).
+    """
+    digest = hashlib.sha256(os.fsencode(ref_file_path)).hexdigest()[:32]
+    return os.path.join(_ref_cache_dir(), digest + _REF_CACHE_SUFFIX)
+
+
+def _read_ref_cache(cache_path: str, key: Tuple) -> Optional[Dict[str, List[str]]]:
+    """Return cached reference data, or ``None`` if missing, stale or invalid.
+
+    The cache file is plain JSON (never unpickled) and its shape is checked
+    before use.
+    """
+    try:
+        with open(cache_path, encoding="utf-8") as fh:
+            cached = json.load(fh)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("Ignoring unreadable reference cache %s: %s", cache_path, e)
+        return None
+    # JSON has no tuples: compare against the key as it was written
+    expected_key = json.loads(json.dumps(key))
+    if not isinstance(cached, dict) or cached.get("key") != expected_key:
+        return None
+    kinase_ref_data = cached.get("data")
+    if not isinstance(kinase_ref_data, dict) or not all(
+        isinstance(seqs, list) and all(isinstance(s, str) for s in seqs)
+        for seqs in kinase_ref_data.values()
+    ):
+        logger.debug("Ignoring malformed reference cache %s", cache_path)
+        return None
+    return kinase_ref_data
+
+
+def _write_ref_cache(cache_path: str, key: Tuple, kinase_ref_data: Dict) -> None:
+    """Store reference data in the cache directory (best effort)."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump({"key": key, "data": kinase_ref_data}, fh)
+        os.replace(tmp_path, cache_path)
+        logger.info("Reference cache written to %s", cache_path)
+    except OSError as e:
+        logger.debug("Could not write reference cache %s: %s", cache_path, e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_reference_data(
+    ref_file_path: str,
+    use_cache: bool = True,
+) -> Dict[str, List[str]]:
     """Load substrate reference sequences from a PhosphoSitePlus Excel file.
 
     Each worksheet whose name matches a known kinase keyword is read, and
     the ``SITE_+/-7_AA`` column is extracted as a list of cleaned reference
     sequences for that kinase.
 
+    Parsing the workbook dominates validation start-up, so the result is
+    stored in a per-user cache directory (see ``_ref_cache_dir``), in a
+    file named by a hash of the workbook's absolute path, and reused for
+    as long as the workbook's modification time and size are unchanged.
+    It is also memoised in-process under the same key, so repeated runs
+    (e.g. from the GUI, or when the cache cannot be written) skip disk
+    entirely.
+    Pass ``use_cache=False`` to always re-read the workbook.  File-like
+    objects and buffers have no modification time and are never cached.
+    """
+    if not use_cache or not (
+        isinstance(ref_file_path, str) or hasattr(ref_file_path, "__fspath__")
+    ):
+        return _parse_reference_workbook(ref_file_path)
+
+    ref_file_path = os.path.abspath(os.fspath(ref_file_path))
+    cached = _load_reference_cached(ref_file_path, _ref_cache_key(ref_file_path))
+    # Fresh lists so callers cannot alter the memoised copy
+    return {k_name: list(seqs) for k_name, seqs in cached.items()}
+
+
+@lru_cache(maxsize=4)
+def _load_reference_cached(
+    ref_file_path: str, key: Tuple
+) -> Dict[str, Tuple[str, ...]]:
+    """Load one version (*key*) of a workbook via its cache file."""
+    cache_path = _ref_cache_path(ref_file_path)
+    kinase_ref_data = _read_ref_cache(cache_path, key)
+    if kinase_ref_data is not None:
+        logger.info(
+            "Reference data loaded from cache: %d / %d kinases",
+            len(kinase_ref_data),
+            len(KINASE_KEYS),
+        )
+    else:
+        kinase_ref_data = _parse_reference_workbook(ref_file_path)
+        _write_ref_cache(cache_path, key, kinase_ref_data)
+    return {k_name: tuple(seqs) for k_name, seqs in kinase_ref_data.items()}
+
+
+def _parse_reference_workbook(ref_file_path: str) -> Dict[str, List[str]]:
+    """Read the reference sequences of every kinase sheet in the workbook.
+
     The file is opened once via ``pd.ExcelFile`` and individual sheets are
     read with ``.parse()`` for efficiency.
     """
@@ -72,14 +224,13 @@ def load_reference_data(ref_file_path: str) -> Dict[str, List[str]]:
         if target_sheet:
             df_ref = excel_reader.parse(target_sheet)
             if "SITE_+/-7_AA" in df_ref.columns:
-                seqs = (
-                    df_ref["SITE_+/-7_AA"]
-                    .astype(str)
-                    .str.replace("_", "", regex=False)
-                    .str.upper()
-                    .str.strip()
-                    .unique()
-                    .tolist()
+                # One pass over the non-blank cells (blank cells would stay
+                # NaN under pandas 3's astype(str)); dict keeps first-seen order
+                seqs = list(
+                    dict.fromkeys(
+                        str(v).replace("_", "").upper().strip()
+                        for v in df_ref["SITE_+/-7_AA"].dropna().tolist()
+                    )
                 )
                 kinase_ref_data[k_name] = seqs
                 logger.debug(
@@ -103,15 +254,84 @@ def load_reference_data(ref_file_path: str) -> Dict[str, List[str]]:
 
 
 # ---------------------------------------------------------------------------
-# Kinase-name exact matching
+# Reference substring index
 # ---------------------------------------------------------------------------
-def _kinase_names_match(pred: str, actual: str) -> bool:
-    """Return True if *pred* and *actual* refer to the same kinase.
+class _ReferenceIndex(NamedTuple):
+    """Lookup structures for motif ↔ reference containment tests."""
 
-    Uses normalised exact comparison to avoid false positives from
-    substring matching (e.g. ``CK1`` must not match ``CK12``).
+    # (kinase, [(length, refs of that length joined by _REF_SEP), ...]) with
+    # the buckets ordered by descending length
+    joined: List[Tuple[str, List[Tuple[int, str]]]]
+    kinases_by_seq: Dict[str, Set[str]]  # reference sequence → kinases
+    lengths: List[int]  # distinct reference lengths, ascending
+
+
+def _build_reference_index(kinase_ref_data: Dict[str, List[str]]) -> _ReferenceIndex:
+    """Index reference sequences for both containment directions.
+
+    Sequences shorter than ``_MIN_MATCH_LEN`` can never satisfy the
+    length guard in either direction and are dropped here.
+    """
+    joined: List[Tuple[str, List[Tuple[int, str]]]] = []
+    kinases_by_seq: Dict[str, Set[str]] = {}
+    for k_name, ref_seqs in kinase_ref_data.items():
+        by_len: Dict[int, List[str]] = {}
+        for s in ref_seqs:
+            if len(s) >= _MIN_MATCH_LEN:
+                by_len.setdefault(len(s), []).append(s)
+                kinases_by_seq.setdefault(s, set()).add(k_name)
+        buckets = [
+            (length, _REF_SEP.join(by_len[length]))
+            for length in sorted(by_len, reverse=True)
+        ]
+        joined.append((k_name, buckets))
+    lengths = sorted({len(s) for s in kinases_by_seq})
+    return _ReferenceIndex(joined, kinases_by_seq, lengths)
+
+
+def _contained_in_refs(p_motif: str, buckets: List[Tuple[int, str]]) -> bool:
+    """Return True if *p_motif* is a substring of a reference in *buckets*.
+
+    Only references at least as long as the motif can contain it, so the
+    scan stops at the first shorter bucket.  Motifs are usually longer
+    than every 15-mer reference and skip the search entirely.
+    """
+    p_len = len(p_motif)
+    for length, refs in buckets:
+        if length < p_len:
+            return False
+        if p_motif in refs:
+            return True
+    return False
+
+
+def _find_reference_kinases(p_motif: str, index: _ReferenceIndex) -> List[str]:
+    """Return kinases with a reference sequence containing, or contained in,
+    *p_motif* (in reference-data order).
+
+    * ``p_motif in s`` — one substring search per reference-length bucket
+      that is long enough to hold the motif (see ``_contained_in_refs``).
+    * ``s in p_motif`` — every shorter window of the motif is looked up in
+      ``kinases_by_seq``, so the cost depends on the motif length only.
     """
-    return _normalize_name_for_matching(pred) == _normalize_name_for_matching(actual)
+    p_len = len(p_motif)
+    if p_len < _MIN_MATCH_LEN:
+        return []
+
+    contained: Set[str] = set()
+    for length in index.lengths:
+        if length >= p_len:
+            break
+        for i in range(p_len - length + 1):
+            hit = index.kinases_by_seq.get(p_motif[i : i + length])
+            if hit:
+                contained |= hit
+
+    return [
+        k_name
+        for k_name, buckets in index.joined
+        if k_name in contained or _contained_in_refs(p_motif, buckets)
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -120,69 +340,75 @@ def _kinase_names_match(pred: str, actual: str) -> bool:
 def validate_predictions(
     pm_df: pd.DataFrame,
     ref_file_path: str,
+    use_cache: bool = True,
 ) -> Tuple[pd.DataFrame, Dict]:
     """Validate kinase predictions against PhosphoSitePlus reference data.
 
     For each motif in *pm_df*, checks whether it appears in any reference
     kinase's substrate list (subsequence search with minimum length guard),
     then verifies whether the predicted kinase matches any found reference
-    kinase using **exact** name comparison.
+    kinase using **exact** name comparison.  *use_cache* is passed on to
+    ``load_reference_data``.
 
     Returns
     -------
     tuple[pd.DataFrame, dict]
         ``(annotated_df, accuracy_summary)``
     """
-    kinase_ref_data = load_reference_data(ref_file_path)
-    results: List[dict] = []
-
-    for _, row in pm_df.iterrows():
-        p_motif = str(row["Motif"]).upper()
-        p_preds_raw = (
-            str(row["Kinase Name"]) if pd.notna(row["Kinase Name"]) else ""
-        )
+    kinase_ref_data = load_reference_data(ref_file_path, use_cache=use_cache)
+    ref_index = _build_reference_index(kinase_ref_data)
+    # Result columns, filled row by row
+    in_psp: List[bool] = []
+    correct: List[bool] = []
+    actual_names: List[str] = []
+
+    # Convert the two input columns once instead of boxing every row
+    motifs = [str(m).upper() for m in pm_df["Motif"].tolist()]
+    preds_col = pm_df["Kinase Name"].fillna("").astype(str).tolist()
+
+    # Normalised rows repeat each motif once per predicted kinase, so the
+    # reference lookup runs once per distinct motif: (joined names, name set)
+    found_by_motif: Dict[str, Tuple[str, FrozenSet[str]]] = {}
+
+    for p_motif, p_preds_raw in zip(motifs, preds_col):
         p_preds = [p.strip() for p in p_preds_raw.split(",") if p.strip()]
 
-        # Find all reference kinases whose substrates contain this motif
-        # Guard: require minimum sequence length to prevent trivial matches
-        found_kinases: List[str] = []
-        for k_name, ref_seqs in kinase_ref_data.items():
-            if any(
-                (len(p_motif) >= _MIN_MATCH_LEN and p_motif in s)
-                or (len(s) >= _MIN_MATCH_LEN and s in p_motif)
-                for s in ref_seqs
-            ):
-                found_kinases.append(k_name)
-
-        # Check correctness using exact name matching
-        is_correct = False
-        if found_kinases:
-            for pred in p_preds:
-                if is_correct:
-                    break
-                for actual in found_kinases:
-                    if _kinase_names_match(pred, actual):
-                        is_correct = True
-                        break
-
-        results.append(
-            {
-                "In_PSP": len(found_kinases) > 0,
-                "Correct": is_correct,
-                "Actual_Kinases_in_PSP": ", ".join(found_kinases),
-            }
+        found = found_by_motif.get(p_motif)
+        if found is None:
+            # Find all reference kinases whose substrates contain this motif
+            # Guard: require minimum sequence length to prevent trivial matches
+            found_kinases = _find_reference_kinases(p_motif, ref_index)
+            found = (
+                ", ".join(found_kinases),
+                frozenset(_normalize_name_for_matching(k) for k in found_kinases),
+            )
+            found_by_motif[p_motif] = found
+        actual_str, found_set = found
+
+        # Check correctness using exact normalised-name matching (so e.g.
+        # CK1 must not match CK12): one lookup per predicted kinase
+        is_correct = any(
+            _normalize_name_for_matching(pred) in found_set for pred in p_preds
         )
 
-    res_df = pd.DataFrame(results)
-    final_df = pd.concat([pm_df, res_df], axis=1)
+        in_psp.append(bool(found_set))
+        correct.append(is_correct)
+        actual_names.append(actual_str)
 
-    valid_rows = res_df[res_df["In_PSP"]]
-    n_correct = int(valid_rows["Correct"].sum()) if not valid_rows.empty else 0
-    acc = (n_correct / len(valid_rows) * 100) if not valid_rows.empty else 0.0
+    # assign() copies pm_df once and attaches the columns positionally
+    final_df = pm_df.assign(
+        In_PSP=in_psp,
+        Correct=correct,
+        Actual_Kinases_in_PSP=actual_names,
+    )
+
+    n_matched = sum(in_psp)
+    n_correct = sum(c for c, m in zip(correct, in_psp) if m)
+    acc = (n_correct / n_matched * 100) if n_matched else 0.0
 
     acc_summary = {
         "total_motifs": len(pm_df),
-        "matched_psp": len(valid_rows),
+        "matched_psp": n_matched,
         "correct": n_correct,
         "acc_percent": float(acc),
     }
@@ -203,7 +429,7 @@ def _parse_field(s) -> List[str]:
     """Split a comma/semicolon-separated field into trimmed strings."""
     if pd.isna(s):
         return []
-    return [p.strip() for p in re.split(r"[;,]", str(s)) if p.strip()]
+    return [p.strip() for p in _FIELD_SPLIT_RE.split(str(s)) if p.strip()]
 
 
 def calculate_f1_metrics(df: pd.DataFrame) -> Dict[str, float]:
@@ -218,26 +444,43 @@ def calculate_f1_metrics(df: pd.DataFrame) -> Dict[str, float]:
     dict
         Keys: ``precision``, ``recall``, ``f1_score``, ``tp``, ``fp``, ``fn``
     """
+    # Parse each distinct field string once; many rows repeat the same value
+    name_sets: Dict[str, FrozenSet[str]] = {}
+
+    def _name_set(field) -> FrozenSet[str]:
+        key = str(field)
+        names = name_sets.get(key)
+        if names is None:
+            names = frozenset(_normalize_name_for_matching(p) for p in _parse_field(key))
+            name_sets[key] = names
+        return names
+
+    # One pass over the rows, collecting per motif the actual kinases of the
+    # first row that has them and the union of all predicted kinases.
+    actual_by_motif: Dict[str, FrozenSet[str]] = {}
+    preds_by_motif: Dict[str, Set[str]] = {}
+    for motif, actual, preds in zip(
+        df["Motif"].tolist(),
+        df["Actual_Kinases_in_PSP"].tolist(),
+        df["Kinase Name"].tolist(),
+    ):
+        if pd.isna(motif):
+            continue
+        pred_set = preds_by_motif.setdefault(motif, set())
+        if not pd.isna(preds):
+            pred_set |= _name_set(preds)
+        if motif not in actual_by_motif and not pd.isna(actual):
+            actual_by_motif[motif] = _name_set(actual)
+
     total_tp = 0
     total_fp = 0
     total_fn = 0
-
-    for _, group in df.groupby("Motif"):
-        # Actual kinases from PSP
-        actual_raw = group["Actual_Kinases_in_PSP"].dropna()
-        actual_list = _parse_field(actual_raw.iloc[0]) if not actual_raw.empty else []
-        actual_set = {_normalize_name_for_matching(a) for a in actual_list}
-
-        # Predicted kinases
-        preds_raw = group["Kinase Name"].dropna().astype(str).tolist()
-        pred_set: set = set()
-        for item in preds_raw:
-            for p in _parse_field(item):
-                pred_set.add(_normalize_name_for_matching(p))
-
-        total_tp += len(pred_set & actual_set)
-        total_fp += len(pred_set - actual_set)
-        total_fn += len(actual_set - pred_set)
+    for motif, pred_set in preds_by_motif.items():
+        actual_set = actual_by_motif.get(motif, frozenset())
+        n_tp = len(pred_set & actual_set)
+        total_tp += n_tp
+        total_fp += len(pred_set) - n_tp
+        total_fn += len(actual_set) - n_tp
 
     precision = total_tp / (total_tp + total_fp) if (total_tp + total_fp) > 0 else 0.0
     recall = total_tp / (total_tp + total_fn) if (total_tp + total_fn) > 0 else 0.0
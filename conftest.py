@@ -0,0 +1,2 @@
+"""Root conftest: puts the repository root on ``sys.path`` so that plain
+``pytest`` (not only ``python -m pytest``) can import ``Phosphom``."""
@@ -0,0 +1,72 @@
+"""Shared fixtures: a small annotated Word document and the reference."""
+
+import pandas as pd
+import pytest
+from docx import Document
+
+from Phosphom.pipeline import DEFAULT_REF_PATH
+from Phosphom.validation import _load_reference_cached, load_reference_data
+
+# Two proteins built around PhosphoSitePlus substrate windows, so that the
+# mapped peptides are also found by validation.
+SEQ1 = (
+    "MASTQKLPGE" "VVGARRSSWRVVSSI" "DEKLPNQWYA" "SSLHRTSSGTSLSAM"
+    "HKLEEGAPVW" "ATRKRRWSAPESRKL" "NPQDFLE"
+)
+SEQ2 = "MGDKPLAWEQ" "EQRSGSSTPQRSCSA" "LLKDEWPQNA" "PFRGRSRSAPPNLWA" "GTVKEDL"
+
+
+def build_input_docx(path):
+    """Write the unmapped input document used by the round-trip tests."""
+    doc = Document()
+    doc.add_paragraph(">sp|P12345|ABC1_HUMAN Test protein one")
+    doc.add_paragraph(SEQ1[:40] + " " + SEQ1[40:])
+    doc.add_paragraph("GARRS(0.912)SWRVV (16)")
+    doc.add_paragraph("LHRT(0.55)SS(0.41)GTSL (46, 48)")
+    doc.add_paragraph("RKRRW\tS(0.77)APES (76)")  # tab: python-docx run path
+    doc.add_paragraph("QQQQS(0.9)QQ (1)")  # not in the sequence
+    doc.add_paragraph("NP_000001.1 ABC2 protein isoform 2 (ABC2)")
+    doc.add_paragraph(SEQ2)
+    doc.add_paragraph("QRSGS(0.66)STPQR (16)")
+    doc.add_paragraph("GRS(0.58)RSAPP (30)")
+    doc.save(path)
+
+
+@pytest.fixture
+def input_docx(tmp_path):
+    path = str(tmp_path / "input.docx")
+    build_input_docx(path)
+    return path
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_ref_cache(tmp_path_factory):
+    """Keep reference caches written by the tests out of the user's cache."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("PHOSPHOM_CACHE_DIR", str(tmp_path_factory.mktemp("refcache")))
+        yield
+
+
+@pytest.fixture(scope="session")
+def ref_path():
+    """The bundled workbook, parsed once and then served from the memo."""
+    load_reference_data(DEFAULT_REF_PATH)
+    return DEFAULT_REF_PATH
+
+
+@pytest.fixture
+def small_ref_path(tmp_path, monkeypatch):
+    """A tiny private workbook with its own, empty cache directory."""
+    path = str(tmp_path / "ref.xlsx")
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        pd.DataFrame(
+            {"SITE_+/-7_AA": ["vvgarrSswrvvssi", None, "GPRSRSrSRDRRRKE"]}
+        ).to_excel(writer, sheet_name="PKA", index=False)
+        pd.DataFrame({"SITE_+/-7_AA": ["SSLHRTsSGTSLSAM"]}).to_excel(
+            writer, sheet_name="AMPK", index=False
+        )
+        pd.DataFrame({"Other": ["x"]}).to_excel(writer, sheet_name="Notes", index=False)
+    monkeypatch.setenv("PHOSPHOM_CACHE_DIR", str(tmp_path / "cache"))
+    _load_reference_cached.cache_clear()
+    yield path
+    _load_reference_cached.cache_clear()
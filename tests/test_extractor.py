@@ -0,0 +1,62 @@
+"""Extraction from mapped documents.
+
+Expected rows were produced by the v2.0.0 baseline, which read paragraph
+text through ``Document(...).paragraphs``.
+"""
+
+from docx import Document
+
+from Phosphom.extractor import extract_data_from_docx, iter_paragraph_texts
+from Phosphom.mapping import start_mapping
+
+
+def test_extracted_rows_match_baseline(input_docx, tmp_path):
+    out = str(tmp_path / "mapped.docx")
+    start_mapping(input_docx, out)
+
+    df = extract_data_from_docx(out)
+    assert df.to_dict("list") == {
+        "Gene Name": ["ABC1", "ABC1", "ABC1", "ABC1", "ABC2", "ABC2"],
+        "Motif": [
+            "GARRSSWRVV",
+            "LHRTSSGTSL",
+            "RKRRWSAPES",
+            "QQQQSQQ",
+            "QRSGSSTPQR",
+            "GRSRSAPP",
+        ],
+        "Kinase Name": [
+            "PKA, RSK, CaMK2, MK2",
+            "PKA, AMPK, PKD, GSK-3beta, CK1, CaMK2, MK2",
+            "PKA, RSK, GSK-3beta, CK1, CaMK2, MK2",
+            "",
+            "PKA, CDK, GSK-3beta, BUB1, CK1, IKK, CaMK2, MK2",
+            "PKA, CaMK2, Chk1, NEK2, MK2",
+        ],
+        "Confidence": [
+            "0.60, 0.60, 0.55, 0.55",
+            "0.60, 0.70, 0.70, 0.30, 0.45, 0.55, 0.65",
+            "0.60, 0.60, 0.30, 0.45, 0.55, 0.55",
+            "",
+            "0.60, 0.80, 0.30, 0.70, 0.45, 0.80, 0.55, 0.55",
+            "0.60, 0.55, 0.65, 0.65, 0.55",
+        ],
+    }
+
+
+def test_iter_paragraph_texts_matches_python_docx(tmp_path):
+    path = str(tmp_path / "layout.docx")
+    doc = Document()
+    doc.add_paragraph("plain")
+    para = doc.add_paragraph("tab\there")
+    para.add_run().add_break()  # line break
+    para.add_run("after break")
+    doc.add_table(rows=1, cols=1).cell(0, 0).text = "cell text (skipped)"
+    doc.add_paragraph("")
+    doc.add_page_break()
+    for i in range(50):  # enough paragraphs to exercise the streaming cleanup
+        doc.add_paragraph(f"  padded {i}  ")
+    doc.save(path)
+
+    expected = [p.text for p in Document(path).paragraphs]
+    assert list(iter_paragraph_texts(path)) == expected
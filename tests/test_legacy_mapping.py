@@ -0,0 +1,100 @@
+"""The standalone mapping scripts at the repository root.
+
+Expected runs were produced by the baseline scripts, which built every
+run with ``add_run`` and set ``font.highlight_color`` per run.
+"""
+
+import importlib.util
+import os
+
+import pytest
+from docx import Document
+from docx.enum.text import WD_COLOR_INDEX
+
+pytest.importorskip("tkinter")  # the scripts import it at module level
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GRAY = WD_COLOR_INDEX.GRAY_25
+YELLOW = WD_COLOR_INDEX.YELLOW
+RED = WD_COLOR_INDEX.RED
+
+SEQ1_RUNS = [
+    ("MASTQKLPGEVV", None),
+    ("GARR", GRAY),
+    ("S", YELLOW),
+    ("SWRVV", GRAY),
+    ("SSIDEKLPNQWYASS", None),
+    ("LHR", GRAY),
+    ("T", YELLOW),
+    ("S", GRAY),
+    ("S", YELLOW),
+    ("GTSL", GRAY),
+    ("SAMHKLEEGAPVWAT", None),
+    ("RKRRW", GRAY),
+    ("S", YELLOW),
+    ("APES", GRAY),
+    ("RKLNPQDFLE", None),
+]
+
+
+def _load_script(file_name):
+    spec = importlib.util.spec_from_file_location(
+        "legacy_" + file_name[0], os.path.join(ROOT, file_name)
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _runs(para):
+    return [(r.text, r.font.highlight_color) for r in para.runs]
+
+
+@pytest.mark.parametrize(
+    "file_name, labels",
+    [
+        ("0AutoMapping.py", [" (17)", " (41, 43)", " (68)"]),
+        (
+            "1AutoMapping&aging_allkinase.py",
+            [
+                " (17 PKA, RSK, CaMK2)",
+                " (41 PKA, AMPK, PKD, GSK-3beta, CK1, CaMK2, MK2, "
+                "43 PKA, AMPK, PKD, GSK-3beta, CK1, CaMK2, MK2)",
+                " (68 PKA, RSK, GSK-3beta, CK1, CaMK2)",
+            ],
+        ),
+    ],
+)
+def test_mapped_runs_match_baseline(input_docx, tmp_path, file_name, labels):
+    script = _load_script(file_name)
+    out = str(tmp_path / "mapped.docx")
+    assert script.start_mapping(input_docx, out) == 5
+
+    paras = Document(out).paragraphs
+    assert _runs(paras[1]) == SEQ1_RUNS
+    assert _runs(paras[2]) == [
+        ("GARR", None),
+        ("S", RED),
+        ("(0.912)", YELLOW),
+        ("SWRVV", None),
+        (labels[0], None),
+    ]
+    assert _runs(paras[3]) == [
+        ("LHR", None),
+        ("T", RED),
+        ("(0.55)", YELLOW),
+        ("S", None),
+        ("S", RED),
+        ("(0.41)", YELLOW),
+        ("GTSL", None),
+        (labels[1], None),
+    ]
+    # The tab is written as <w:tab/> and read back as "\t"
+    assert _runs(paras[4]) == [
+        ("RKRRW\t", None),
+        ("S", RED),
+        ("(0.77)", YELLOW),
+        ("APES", None),
+        (labels[2], None),
+    ]
+    assert _runs(paras[5]) == [("QQQQS(0.9)QQ (1)", None)]  # left untouched
@@ -0,0 +1,75 @@
+"""Mapping of phospho-sites in Word documents.
+
+Expected runs were produced by the v2.0.0 baseline, which built every run
+with ``add_run`` and set ``font.highlight_color`` per run.
+"""
+
+from docx import Document
+from docx.enum.text import WD_COLOR_INDEX
+
+from Phosphom.mapping import start_mapping
+
+GRAY = WD_COLOR_INDEX.GRAY_25
+YELLOW = WD_COLOR_INDEX.YELLOW
+RED = WD_COLOR_INDEX.RED
+
+
+def _runs(para):
+    return [(r.text, r.font.highlight_color) for r in para.runs]
+
+
+def test_mapped_runs_match_baseline(input_docx, tmp_path):
+    out = str(tmp_path / "mapped.docx")
+    assert start_mapping(input_docx, out) == 5
+
+    paras = Document(out).paragraphs
+    assert _runs(paras[1]) == [
+        ("MASTQKLPGEVV", None),
+        ("GARR", GRAY),
+        ("S", YELLOW),
+        ("SWRVV", GRAY),
+        ("SSIDEKLPNQWYASS", None),
+        ("LHR", GRAY),
+        ("T", YELLOW),
+        ("S", GRAY),
+        ("S", YELLOW),
+        ("GTSL", GRAY),
+        ("SAMHKLEEGAPVWAT", None),
+        ("RKRRW", GRAY),
+        ("S", YELLOW),
+        ("APES", GRAY),
+        ("RKLNPQDFLE", None),
+    ]
+    assert paras[1].text == Document(input_docx).paragraphs[1].text.replace(" ", "")
+    assert _runs(paras[2]) == [
+        ("GARR", None),
+        ("S", RED),
+        ("(0.912)", YELLOW),
+        ("SWRVV", None),
+        (" (17 PKA:0.60, RSK:0.60, CaMK2:0.55)", None),
+    ]
+    assert _runs(paras[3]) == [
+        ("LHR", None),
+        ("T", RED),
+        ("(0.55)", YELLOW),
+        ("S", None),
+        ("S", RED),
+        ("(0.41)", YELLOW),
+        ("GTSL", None),
+        (
+            " (41 AMPK:0.70, PKD:0.70, MK2:0.65, PKA:0.60, CaMK2:0.55, "
+            "CK1:0.45, GSK-3beta:0.30, 43 AMPK:0.70, PKD:0.70, MK2:0.65, "
+            "PKA:0.60, CaMK2:0.55, CK1:0.45, GSK-3beta:0.30)",
+            None,
+        ),
+    ]
+    # Tabs go through python-docx and come back as <w:tab/>
+    assert _runs(paras[4]) == [
+        ("RKRRW\t", None),
+        ("S", RED),
+        ("(0.77)", YELLOW),
+        ("APES", None),
+        (" (68 PKA:0.60, RSK:0.60, CaMK2:0.55, CK1:0.45, GSK-3beta:0.30)", None),
+    ]
+    assert _runs(paras[5]) == [("QQQQS(0.9)QQ (1)", None)]  # left untouched
+
@@ -0,0 +1,78 @@
+"""Normalisation and cell-signal tables."""
+
+import pandas as pd
+
+from Phosphom.motif_db import CELL_SIGNAL_MAP, _normalize_kinase_key
+from Phosphom.normalization import build_cell_signal_tables, normalize_kinase_rows
+
+
+def _normalised():
+    df = pd.DataFrame(
+        {
+            "Gene Name": ["ABC2", "ABC1", "ABC1", "ABC2", "ABC1"],
+            "Motif": [
+                "QRSGSSTPQR",
+                "GARRSSWRVV",
+                "LHRTSSGTSL",
+                "GRSRSAPP",
+                "GARRSSWRVV",
+            ],
+            "Kinase Name": [
+                "PKA, CDK, GSK-3beta",
+                "PKA, RSK, CaMK2",
+                "PKA, AMPK, CK1",
+                "PKA, CaMK2, Chk1, NotAKinase",
+                "MK2, PKA",
+            ],
+            "Confidence": ["0.60, 0.80, 0.30", "0.60, 0.60", "", "0.60", "0.65, 0.60"],
+        }
+    )
+    return normalize_kinase_rows(df)
+
+
+def test_normalize_kinase_rows():
+    norm = _normalised()
+    assert norm.index.tolist() == list(range(len(norm)))
+    rows = norm[norm["Motif"] == "GARRSSWRVV"]
+    assert rows[["Kinase Name", "Confidence"]].values.tolist() == [
+        ["PKA", "0.60"],
+        ["RSK", "0.60"],
+        ["CaMK2", ""],
+        ["MK2", "0.65"],
+    ]
+    rows = norm[norm["Motif"] == "LHRTSSGTSL"]  # no scores: padded with ""
+    assert rows[["Kinase Name", "Confidence"]].values.tolist() == [
+        ["PKA", ""],
+        ["AMPK", ""],
+        ["CK1", ""],
+    ]
+
+
+def test_gene_summary_joins_align_with_groups():
+    norm = _normalised()
+    # Row order and index must not matter to the per-group joins
+    shuffled = norm.sample(frac=1, random_state=3)
+    shuffled.index = shuffled.index * 7 + 100
+
+    gene_summary, overall, top_kinases = build_cell_signal_tables(shuffled)
+    expected = build_cell_signal_tables(norm)
+    pd.testing.assert_frame_equal(gene_summary, expected[0])
+    pd.testing.assert_frame_equal(overall, expected[1])
+    pd.testing.assert_frame_equal(top_kinases, expected[2])
+
+    # Reference: the groupby.apply joins the one-pass bucketing replaced
+    temp = norm.assign(
+        **{
+            "Cell Signal": [
+                CELL_SIGNAL_MAP.get(_normalize_kinase_key(k))
+                for k in norm["Kinase Name"]
+            ]
+        }
+    ).dropna(subset=["Cell Signal"])
+    grouped = temp.groupby(["Gene Name", "Cell Signal"])
+    for col, joined_col in (("Motif", "Motifs"), ("Kinase Name", "Kinases")):
+        reference = grouped[col].apply(
+            lambda s: ", ".join(sorted({str(v).strip() for v in s} - {""}))
+        )
+        actual = gene_summary.set_index(["Gene Name", "Cell Signal"])[joined_col]
+        assert {(g, str(c)): v for (g, c), v in actual.items()} == reference.to_dict()
@@ -0,0 +1,113 @@
+"""The per-user JSON cache of parsed reference workbooks."""
+
+import io
+import json
+import os
+import sys
+
+import pytest
+
+from Phosphom.validation import (
+    _load_reference_cached,
+    _ref_cache_dir,
+    _ref_cache_key,
+    _ref_cache_path,
+    load_reference_data,
+)
+
+EXPECTED = {"PKA": ["VVGARRSSWRVVSSI", "GPRSRSRSRDRRRKE"], "AMPK": ["SSLHRTSSGTSLSAM"]}
+SENTINEL = {"PKA": ["SENTINELSEQUENCE"]}
+
+
+def _reload(path):
+    _load_reference_cached.cache_clear()  # force the cache file to be read
+    return load_reference_data(path)
+
+
+def _rewrite_cache(path, **changes):
+    cache_path = _ref_cache_path(os.path.abspath(path))
+    with open(cache_path, encoding="utf-8") as fh:
+        cached = json.load(fh)
+    cached.update(changes)
+    with open(cache_path, "w", encoding="utf-8") as fh:
+        json.dump(cached, fh)
+
+
+def test_cache_is_written_to_the_cache_dir_and_reused(small_ref_path, tmp_path):
+    assert load_reference_data(small_ref_path) == EXPECTED
+
+    cache_path = _ref_cache_path(os.path.abspath(small_ref_path))
+    assert os.path.dirname(cache_path) == str(tmp_path / "cache")
+    with open(cache_path, encoding="utf-8") as fh:
+        assert json.load(fh)["data"] == EXPECTED
+    assert sorted(os.listdir(tmp_path)) == ["cache", "ref.xlsx"]  # nothing beside it
+
+    # A valid cache file is served as is: the workbook is not parsed again
+    _rewrite_cache(small_ref_path, data=SENTINEL)
+    assert _reload(small_ref_path) == SENTINEL
+
+
+def test_stale_cache_is_replaced(small_ref_path):
+    load_reference_data(small_ref_path)
+    _rewrite_cache(small_ref_path, data=SENTINEL)
+
+    # The workbook changes after the cache file was written
+    st = os.stat(small_ref_path)
+    os.utime(small_ref_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    assert _reload(small_ref_path) == EXPECTED
+    with open(_ref_cache_path(os.path.abspath(small_ref_path)), encoding="utf-8") as fh:
+        assert json.load(fh)["data"] == EXPECTED
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "{not json",
+        "[]",
+        '{"key": null, "data": {}}',
+        None,  # right key, malformed data
+    ],
+)
+def test_corrupted_cache_is_ignored(small_ref_path, content):
+    cache_path = _ref_cache_path(os.path.abspath(small_ref_path))
+    if content is None:
+        key = _ref_cache_key(small_ref_path)
+        content = json.dumps({"key": key, "data": {"PKA": "not a list"}})
+    os.makedirs(os.path.dirname(cache_path))
+    with open(cache_path, "w", encoding="utf-8") as fh:
+        fh.write(content)
+
+    assert load_reference_data(small_ref_path) == EXPECTED
+
+
+def test_use_cache_false_writes_nothing(small_ref_path, tmp_path):
+    assert load_reference_data(small_ref_path, use_cache=False) == EXPECTED
+    assert not os.path.exists(tmp_path / "cache")
+
+
+def test_file_like_reference_bypasses_the_cache(small_ref_path, tmp_path):
+    with open(small_ref_path, "rb") as fh:
+        buffer = io.BytesIO(fh.read())
+
+    assert load_reference_data(buffer) == EXPECTED
+    assert not os.path.exists(tmp_path / "cache")
+
+
+@pytest.mark.skipif(sys.platform in ("win32", "darwin"), reason="XDG layout")
+def test_default_cache_dir_follows_xdg(monkeypatch, tmp_path):
+    monkeypatch.delenv("PHOSPHOM_CACHE_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert _ref_cache_dir() == str(tmp_path / "phosphom")
+
+
+def test_reference_data_is_memoised_in_process(small_ref_path):
+    first = load_reference_data(small_ref_path)
+    os.remove(_ref_cache_path(os.path.abspath(small_ref_path)))
+
+    # Served from memory: neither the cache file nor the workbook is read
+    hits = _load_reference_cached.cache_info().hits
+    first["PKA"].append("MUTATEDSEQUENCE")
+    assert load_reference_data(small_ref_path) == EXPECTED
+    assert _load_reference_cached.cache_info().hits == hits + 1
+    assert not os.path.exists(_ref_cache_path(os.path.abspath(small_ref_path)))
@@ -0,0 +1,161 @@
+"""Validation against the reference workbook.
+
+Expected values were produced by the v2.0.0 baseline, which scanned every
+reference sequence per row with ``iterrows``.
+"""
+
+import pandas as pd
+import pytest
+
+from Phosphom import validation
+from Phosphom.validation import (
+    _MIN_MATCH_LEN,
+    _build_reference_index,
+    _contained_in_refs,
+    _find_reference_kinases,
+    calculate_f1_metrics,
+    load_reference_data,
+    validate_predictions,
+)
+
+PKA_HITS = "PKA, AKT, PKC, p38&MAPK, MK2"
+
+
+def _predictions():
+    return pd.DataFrame(
+        {
+            "Gene Name": ["ABC1", "ABC1", "ABC1", "ABC2", "ABC2", "ABC2"],
+            "Motif": [
+                "GARRSSWRVV",
+                "garrsswrvv",
+                "LHRTSSGTSL",
+                "QQQQSQQ",
+                "XXVVGARRSSWRVVSSIXX",  # contains a reference sequence
+                "RSRS",  # shorter than _MIN_MATCH_LEN
+            ],
+            "Kinase Name": ["PKA", "RSK", "AMPK", "PKA", None, "PKA"],
+        }
+    )
+
+
+def test_validate_predictions_matches_baseline(ref_path):
+    final_df, acc = validate_predictions(_predictions(), ref_path)
+
+    assert final_df["In_PSP"].tolist() == [True, True, True, False, True, False]
+    assert final_df["Correct"].tolist() == [True, False, True, False, False, False]
+    assert final_df["Actual_Kinases_in_PSP"].tolist() == [
+        PKA_HITS, PKA_HITS, "AMPK", "", PKA_HITS, "",
+    ]
+    assert acc == {
+        "total_motifs": 6,
+        "matched_psp": 4,
+        "correct": 2,
+        "acc_percent": 50.0,
+    }
+    assert calculate_f1_metrics(final_df) == {
+        "precision": 0.4,
+        "recall": 0.125,
+        "f1_score": pytest.approx(0.19047619047619047),
+        "tp": 2,
+        "fp": 3,
+        "fn": 14,
+    }
+
+
+def _linear_scan(motif, kinase_ref_data):
+    """The baseline containment test, one reference sequence at a time."""
+    return [
+        k_name
+        for k_name, ref_seqs in kinase_ref_data.items()
+        if any(
+            (len(motif) >= _MIN_MATCH_LEN and motif in s)
+            or (len(s) >= _MIN_MATCH_LEN and s in motif)
+            for s in ref_seqs
+        )
+    ]
+
+
+def _probe_motifs(kinase_ref_data):
+    seqs = kinase_ref_data["PKA"][:40] + kinase_ref_data["AMPK"][:40]
+    return (
+        [s[2:12] for s in seqs]  # inside a reference
+        + ["QW" + s + "YA" for s in seqs]  # around a reference
+        + [s[: _MIN_MATCH_LEN - 1] for s in seqs]  # too short
+        + ["QQQQQQQQQQ"]
+    )
+
+
+def test_reference_index_matches_linear_scan(ref_path):
+    kinase_ref_data = load_reference_data(ref_path)
+    index = _build_reference_index(kinase_ref_data)
+    for motif in _probe_motifs(kinase_ref_data):
+        expected = _linear_scan(motif, kinase_ref_data)
+        assert _find_reference_kinases(motif, index) == expected, motif
+
+
+def test_length_buckets_match_linear_scan():
+    # Mixed reference lengths, so the descending-length buckets and the
+    # early exit at the first too-short bucket are both exercised
+    kinase_ref_data = {
+        "PKA": ["GARRSSWRVV", "RRASVAGLLKSPQEEQ", "LRRASLG", "SHORT"],
+        "AMPK": ["HMRSAMSGLHLVKRRQ", "LRRASLGAA", "MRSAMSG"],
+    }
+    index = _build_reference_index(kinase_ref_data)
+    motifs = [
+        "RRASLG",
+        "LRRASLG",
+        "RRASLGA",
+        "SAMSGLHL",
+        "GARRSSWRVV",
+        "RRASVAGLLKSPQEEQ",
+        "XRRASVAGLLKSPQEEQ",
+        "SHORT",
+    ]
+    for k_name, buckets in index.joined:
+        lengths = [length for length, _ in buckets]
+        assert lengths == sorted(lengths, reverse=True)
+        refs = [s for s in kinase_ref_data[k_name] if len(s) >= _MIN_MATCH_LEN]
+        for motif in motifs:
+            expected = any(motif in s for s in refs)
+            assert _contained_in_refs(motif, buckets) == expected, (k_name, motif)
+    for motif in motifs:
+        expected = _linear_scan(motif, kinase_ref_data)
+        assert _find_reference_kinases(motif, index) == expected, motif
+
+
+def test_reference_lookup_runs_once_per_distinct_motif(ref_path, monkeypatch):
+    calls = []
+
+    def counting(p_motif, index):
+        calls.append(p_motif)
+        return _find_reference_kinases(p_motif, index)
+
+    monkeypatch.setattr(validation, "_find_reference_kinases", counting)
+    # Normalised rows repeat each motif once per predicted kinase
+    pm_df = pd.DataFrame(
+        {
+            "Motif": ["GARRSSWRVV", "GARRSSWRVV", "garrsswrvv", "LHRTSSGTSL"],
+            "Kinase Name": ["PKA", "RSK", "MK2", "AMPK"],
+        }
+    )
+    final_df, _ = validate_predictions(pm_df, ref_path)
+
+    assert sorted(calls) == ["GARRSSWRVV", "LHRTSSGTSL"]
+    assert final_df["Correct"].tolist() == [True, False, True, True]
+    assert final_df["Actual_Kinases_in_PSP"].tolist() == [
+        PKA_HITS, PKA_HITS, PKA_HITS, "AMPK",
+    ]
+
+
+def test_validate_predictions_keeps_a_non_default_index(ref_path):
+    expected, expected_acc = validate_predictions(_predictions(), ref_path)
+
+    pm_df = _predictions()
+    pm_df.index = [50, 40, 30, 20, 10, 0]
+    final_df, acc = validate_predictions(pm_df, ref_path)
+
+    assert final_df.index.tolist() == [50, 40, 30, 20, 10, 0]
+    pd.testing.assert_frame_equal(
+        final_df.reset_index(drop=True), expected, check_index_type=False
+    )
+    assert acc == expected_acc